@@ -2,34 +2,77 @@
 Build script for creating executable versions of SAGE Desktop AI Assistant.
 Supports both PyInstaller and cx_Freeze.
 """
+import hashlib
 import subprocess
 import sys
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+def _remove_dir(dir_name: str) -> str:
+    """Remove a directory tree, using the native rd command on Windows."""
+    if sys.platform == "win32":
+        subprocess.run(["cmd", "/c", "rd", "/s", "/q", dir_name], check=False)
+    shutil.rmtree(dir_name, ignore_errors=True)
+    return dir_name
+
 def clean_build_dirs():
     """Clean previous build directories."""
     print("Cleaning previous build directories...")
     
-    dirs_to_clean = ["build", "dist", "__pycache__"]
+    dirs_to_clean = [d for d in ["build", "dist", "__pycache__"] if Path(d).exists()]
     
-    for dir_name in dirs_to_clean:
-        if Path(dir_name).exists():
-            shutil.rmtree(dir_name)
+    # Deleting many small files is I/O-latency bound, so overlap the removals
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        for dir_name in executor.map(_remove_dir, dirs_to_clean):
             print(f"  Removed {dir_name}")
     
     print("✓ Build directories cleaned")
 
-def build_with_pyinstaller():
+PYINSTALLER_CACHE_DIR = Path(".pyinstaller-cache")
+
+# Modules that get pulled in transitively but are never used at runtime.
+# unittest and tensorflow.python.debug stay in: numpy.testing and the
+# tf.debugging API import them when TensorFlow loads.
+EXCLUDED_MODULES = [
+    "tkinter", "matplotlib", "jupyter",
+    "test", "pydoc_data", "lib2to3", "xmlrpc", "http.server",
+    "setuptools._vendor", "pip", "wheel",
+    "IPython", "notebook", "jedi", "sphinx",
+    "tensorflow.lite.testing",
+]
+
+def get_build_cache_key() -> str:
+    """Hash the inputs that determine PyInstaller's module analysis."""
+    digest = hashlib.sha256()
+    for file_name in ("requirements.txt", "main.py"):
+        digest.update(Path(file_name).read_bytes())
+    return digest.hexdigest()[:16]
+
+def build_with_pyinstaller(cache_key: str):
     """Build executable using PyInstaller."""
     print("\nBuilding with PyInstaller...")
     
+    # Analysis results and compiled bytecode are kept per cache key so
+    # unchanged dependency graphs are not re-analysed on every build
+    cache_dir = PYINSTALLER_CACHE_DIR / cache_key
+    env = dict(os.environ, PYINSTALLER_CONFIG_DIR=str(cache_dir / "config"))
+    
     # PyInstaller command
     cmd = [
         "pyinstaller",
-        "--onefile",
+        # onedir: the onefile bootloader unpacks the whole TF/Keras bundle
+        # into a temp dir on every launch, which dominates startup time.
+        # Binaries and data are then stored uncompressed; only the small
+        # PYZ of pure-Python modules stays zlib-compressed (not configurable).
+        "--onedir",
+        # UPX-packed DLLs are decompressed in memory on every load; the large
+        # TF/Qt binaries gain little from it and pay it at each startup
+        "--noupx",
         "--windowed",
+        "--noconfirm",
+        "--workpath", str(cache_dir / "build"),
         "--name", "SAGE_Assistant",
         "--icon", "assets/icon.ico",  # Add icon if available
         "--add-data", "config;config",
@@ -45,14 +88,15 @@ def build_with_pyinstaller():
         "--hidden-import", "PIL",
         "--hidden-import", "cv2",
         "--hidden-import", "numpy",
-        "--exclude-module", "tkinter",
-        "--exclude-module", "matplotlib",
-        "--exclude-module", "jupyter",
-        "main.py"
+        "--collect-all", "tensorflow",
+        "--collect-all", "keras_ocr",
     ]
+    for module_name in EXCLUDED_MODULES:
+        cmd += ["--exclude-module", module_name]
+    cmd.append("main.py")
     
     try:
-        subprocess.check_call(cmd)
+        subprocess.check_call(cmd, env=env)
         print("✓ PyInstaller build completed successfully")
         return True
     except subprocess.CalledProcessError as e:
@@ -78,7 +122,7 @@ build_options = {
         "keras_ocr", "tensorflow", "mss", "pyttsx3", "pygame", 
         "PIL", "cv2", "numpy", "asyncio", "sqlite3"
     ],
-    "excludes": ["tkinter", "matplotlib", "jupyter"],
+    "excludes": %r,
     "include_files": [
         ("config/", "config/"),
         ("assets/", "assets/")
@@ -105,7 +149,7 @@ setup(
 '''
     
     setup_file = Path("setup_cx.py")
-    setup_file.write_text(setup_content)
+    setup_file.write_text(setup_content % (EXCLUDED_MODULES,))
     
     try:
         subprocess.check_call([sys.executable, "setup_cx.py", "build"])
@@ -134,7 +178,7 @@ echo.
 
 echo Copying files...
 if not exist "%LOCALAPPDATA%\\SAGE" mkdir "%LOCALAPPDATA%\\SAGE"
-copy /Y "SAGE_Assistant.exe" "%LOCALAPPDATA%\\SAGE\\"
+xcopy /E /I /Y "SAGE_Assistant" "%LOCALAPPDATA%\\SAGE" >nul
 copy /Y "config\\*" "%LOCALAPPDATA%\\SAGE\\config\\" 2>nul
 
 echo Creating desktop shortcut...
@@ -161,6 +205,16 @@ pause
     installer_file.write_text(installer_content)
     print("✓ Created installer script: dist/install.bat")
 
+def _link_or_copy(src, dst):
+    """Hard-link a file into place, falling back to a copy across filesystems."""
+    if os.path.lexists(dst):
+        os.unlink(dst)
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
 def package_release():
     """Package the release files."""
     print("\nPackaging release...")
@@ -168,18 +222,24 @@ def package_release():
     release_dir = Path("dist/SAGE_Release")
     release_dir.mkdir(exist_ok=True)
     
-    # Copy executable
+    # Copy executable (onedir builds produce a folder, cx_Freeze a single file)
     exe_files = list(Path("dist").glob("SAGE_Assistant*"))
     if exe_files:
-        shutil.copy2(exe_files[0], release_dir)
+        if exe_files[0].is_dir():
+            shutil.copytree(
+                exe_files[0], release_dir / exe_files[0].name,
+                copy_function=_link_or_copy, dirs_exist_ok=True
+            )
+        else:
+            _link_or_copy(exe_files[0], release_dir / exe_files[0].name)
     
-    # Copy config files
+    # Copy config files (real copies, users are told to edit these)
     if Path("config").exists():
         shutil.copytree("config", release_dir / "config", dirs_exist_ok=True)
     
-    # Copy assets
+    # Link assets
     if Path("assets").exists():
-        shutil.copytree("assets", release_dir / "config", dirs_exist_ok=True)
+        shutil.copytree("assets", release_dir / "assets", copy_function=_link_or_copy, dirs_exist_ok=True)
     
     # Create README
     readme_content = """
@@ -189,7 +249,7 @@ SAGE Desktop AI Assistant
 Installation:
 1. Run install.bat as Administrator (recommended)
    OR
-2. Manually copy SAGE_Assistant.exe to your desired location
+2. Manually copy the SAGE_Assistant folder to your desired location
 
 Configuration:
 1. Edit config/settings.py to set your API keys
@@ -201,7 +261,7 @@ Requirements:
 - Internet connection (for AI responses)
 
 Usage:
-- Double-click SAGE_Assistant.exe to start
+- Double-click SAGE_Assistant/SAGE_Assistant.exe to start
 - Click the expand button to open chat
 - Use the microphone button for voice input
 - Drag the window to move it around
@@ -226,11 +286,16 @@ def main():
     script_dir = Path(__file__).parent
     os.chdir(script_dir)
     
-    # Clean previous builds
-    clean_build_dirs()
+    # Clean previous builds only when the analysis inputs changed
+    cache_key = get_build_cache_key()
+    if (PYINSTALLER_CACHE_DIR / cache_key).exists():
+        print(f"Reusing cached PyInstaller analysis ({cache_key})")
+    else:
+        clean_build_dirs()
+        shutil.rmtree(PYINSTALLER_CACHE_DIR, ignore_errors=True)
     
     # Try building with PyInstaller first
-    success = build_with_pyinstaller()
+    success = build_with_pyinstaller(cache_key)
     
     # If PyInstaller fails, try cx_Freeze
     if not success:
@@ -30,6 +30,7 @@ UI_CONFIG = {
     "animation_duration": 200,
     "always_on_top": True,
     "start_position": (100, 100),
+    "max_live_bubbles": 200,  # Older chat bubbles are dropped from the window
 }
 
 # Voice Configuration
@@ -42,6 +43,22 @@ VOICE_CONFIG = {
     "tts_slow": False,
     "speech_timeout": 5.0,
     "phrase_timeout": 1.0,
+    "pause_threshold": 0.4,  # Seconds of silence that end a phrase
+    "non_speaking_duration": 0.3,  # Silence kept around a phrase; <= pause_threshold
+    "phrase_threshold": 0.2,  # Minimum speech length counted as a phrase
+    "whisper_model": "base.en",  # faster-whisper model used when installed
+    "whisper_compute_type": "int8",
+    "vosk_model_path": None,  # Offline fallback model dir; None fetches the small en-us model
+    "vad_aggressiveness": 2,  # webrtcvad mode, 0 (lenient) to 3 (strict)
+    "vad_silence_ms": 300,  # Silence that ends a speech chunk, shrinking toward the max
+    "vad_max_chunk_ms": 3000,  # Longest speech chunk sent for recognition
+    "calibration_file": BASE_DIR / "data" / "mic_calibration.json",
+    "calibration_max_age": 3600,  # Seconds a saved ambient-noise calibration is reused
+    "precomputed_phrases": [  # Canned lines prewarm_tts() synthesizes into the gTTS cache
+        "Could you say more?",
+        "I apologize, but I encountered an error processing your request.",
+        "Sorry, I encountered an error processing your request.",
+    ],
     "ai_speak_responses": True,  # Whether AI should speak chat responses
     "ai_speak_suggestions": True,  # Whether AI should speak screen suggestions
 }
@@ -54,7 +71,9 @@ AI_CONFIG = {
     "streaming": True,
     "context_window": 4096,
     "screen_capture_interval": 5.0,  # seconds
+    "screen_capture_max_interval": 20.0,  # seconds; capture backs off to this while the screen is idle
     "max_context_history": 10,
+    "suggestion_min_interval": 3.0,  # seconds between proactive suggestion requests
 }
 
 # Screen Reader Configuration
@@ -62,6 +81,9 @@ SCREEN_CONFIG = {
     "ocr_confidence_threshold": 0.5,  # KerasOCR confidence threshold (0.0-1.0)
     "capture_region": None,  # None for full screen, or (x, y, width, height)
     "preprocessing": True,
+    "max_dimension": 1920,  # Frames larger than this (width or height) are downscaled before OCR
+    "hash_distance_threshold": 5,  # dHash bits that must differ to count as a screen change
+    "ocr_tile_grid": 8,  # Frame is split into grid x grid tiles; only changed tiles are re-OCR'd
     "ocr_backend": "keras",  # "keras" or "tesseract" (fallback)
     "model_cache_dir": KERAS_OCR_CACHE_DIR,
 }
@@ -87,6 +109,10 @@ DATABASE_CONFIG = {
     "path": BASE_DIR / "data" / "sage.db",
     "max_history": 1000,
     "cleanup_interval": 24 * 60 * 60,  # 24 hours in seconds
+    "reader_pool_size": min(4, os.cpu_count() or 1),  # Read-only connections
+    "insert_batch_size": 64,  # Max conversation rows per insert batch
+    "insert_batch_wait": 0.05,  # Seconds to wait for a batch to fill
+    "analyze_every_n_cleanups": 7,  # Run ANALYZE on every Nth cleanup
 }
 
 # System Messages
@@ -3,6 +3,7 @@ Main entry point for the SAGE Desktop AI Assistant.
 """
 import sys
 import asyncio
+import importlib.util
 import logging
 import os
 from pathlib import Path
@@ -17,34 +18,25 @@ setup_logging()
 
 logger = logging.getLogger(__name__)
 
+def _is_installed(module_name: str) -> bool:
+    """Check whether a module can be imported without actually importing it."""
+    return importlib.util.find_spec(module_name) is not None
+
+# (module name, pip package name) pairs probed at startup
+REQUIRED_DEPENDENCIES = (
+    ("PySide6", "PySide6"),
+    ("langchain_groq", "langchain-groq"),
+    ("speech_recognition", "SpeechRecognition"),
+    ("keras_ocr", "keras-ocr"),
+    ("mss", "mss"),
+)
+
 def check_dependencies():
     """Check if all required dependencies are available."""
-    missing_deps = []
-    
-    try:
-        import PySide6
-    except ImportError:
-        missing_deps.append("PySide6")
-    
-    try:
-        import langchain_groq
-    except ImportError:
-        missing_deps.append("langchain-groq")
-    
-    try:
-        import speech_recognition
-    except ImportError:
-        missing_deps.append("SpeechRecognition")
-    
-    try:
-        import keras_ocr
-    except ImportError:
-        missing_deps.append("keras-ocr")
-    
-    try:
-        import mss
-    except ImportError:
-        missing_deps.append("mss")
+    missing_deps = [
+        package for module_name, package in REQUIRED_DEPENDENCIES
+        if not _is_installed(module_name)
+    ]
     
     if missing_deps:
         logger.error(f"Missing dependencies: {', '.join(missing_deps)}")
@@ -65,15 +57,14 @@ def check_api_keys():
 
 def check_keras_ocr():
     """Check if KerasOCR is installed and accessible."""
-    try:
-        import keras_ocr
-        # Try to create a pipeline to ensure it works
-        pipeline = keras_ocr.pipeline.Pipeline()
+    # Building the pipeline here would load TensorFlow and the model weights
+    # before the window is even shown; the screen reader owns that step.
+    if _is_installed("keras_ocr") and _is_installed("tensorflow"):
         return True
-    except Exception as e:
-        logger.error(f"KerasOCR not found or not accessible: {e}")
-        logger.error("Please install KerasOCR with: pip install keras-ocr tensorflow")
-        return False
+    
+    logger.error("KerasOCR not found or not accessible")
+    logger.error("Please install KerasOCR with: pip install keras-ocr tensorflow")
+    return False
 
 def main():
     """Main application entry point."""
@@ -3,66 +3,69 @@ AI Agent module using LangChain and Groq for intelligent responses.
 Handles streaming responses, context management, and conversation flow.
 """
 import asyncio
+import collections
+import io
+import itertools
 import logging
+import threading
 import time
-from typing import AsyncGenerator, Optional, List, Dict, Any, Callable
-from dataclasses import dataclass
+from typing import (
+    TYPE_CHECKING, AsyncGenerator, Optional, List, Dict, Any, Callable, Deque, NamedTuple
+)
 import json
 
-from langchain_groq import ChatGroq
-from langchain.schema import HumanMessage, SystemMessage, AIMessage
-from langchain.callbacks.base import AsyncCallbackHandler
-from langchain.callbacks.streaming_stdout import StreamingStdOutCallbackHandler
-
 from config.settings import AI_CONFIG, GROQ_API_KEY, SYSTEM_MESSAGES
-from src.screen_reader import ScreenContext
+
+if TYPE_CHECKING:
+    # langchain_groq and the screen reader's OpenCV/mss stack are imported
+    # lazily; these are only needed for annotations
+    from langchain.schema import SystemMessage
+    from src.screen_reader import ScreenContext
 
 logger = logging.getLogger(__name__)
 
+# LangChain message class for each history role sent to the LLM,
+# filled in by AIAgent._initialize_llm
+_ROLE_TO_CLASS: Dict[str, Any] = {}
 
-@dataclass
-class ConversationMessage:
-    """Represents a single message in the conversation."""
+
+class ConversationMessage(NamedTuple):
+    """Represents a single message in the conversation (no per-instance __dict__)."""
     role: str  # 'user', 'assistant', 'system'
     content: str
-    timestamp: float
+    timestamp: int  # time.monotonic_ns()
     metadata: Optional[Dict[str, Any]] = None
 
 
-class StreamingCallbackHandler(AsyncCallbackHandler):
-    """Custom callback handler for streaming responses."""
-    
-    def __init__(self, callback: Callable[[str], None]):
-        self.callback = callback
-        self.tokens = []
-    
-    async def on_llm_new_token(self, token: str, **kwargs) -> None:
-        """Called when a new token is generated."""
-        if self.callback:
-            self.callback(token)
-    
-    async def on_llm_start(self, serialized: Dict[str, Any], prompts: List[str], **kwargs) -> None:
-        """Called when LLM starts generating."""
-        self.tokens = []
-    
-    async def on_llm_end(self, response, **kwargs) -> None:
-        """Called when LLM finishes generating."""
-        pass
-
-
 class AIAgent:
     """
     Intelligent AI agent powered by LangChain and Groq.
     Handles conversation, context injection, and streaming responses.
     """
     
+    __slots__ = (
+        "llm", "current_screen_context", "max_history", "conversation_history",
+        "streaming_callback", "_last_suggestion_time",
+        "_cached_system_msg", "_cached_ctx_id",
+    )
+    
     def __init__(self):
         self.llm = None
-        self.conversation_history: List[ConversationMessage] = []
-        self.current_screen_context: Optional[ScreenContext] = None
+        self.current_screen_context: Optional["ScreenContext"] = None
         self.max_history = AI_CONFIG["max_context_history"]
+        # Bounded history: old messages fall off the left end in O(1)
+        self.conversation_history: Deque[ConversationMessage] = collections.deque(
+            maxlen=self.max_history * 2
+        )
         self.streaming_callback: Optional[Callable[[str], None]] = None
         
+        # Monotonic time of the last proactive suggestion request
+        self._last_suggestion_time = 0.0
+        
+        # System message is rebuilt only when the screen context changes
+        self._cached_system_msg = None
+        self._cached_ctx_id: Optional[int] = None
+        
         self._initialize_llm()
     
     def _initialize_llm(self):
@@ -71,6 +74,11 @@ class AIAgent:
             if not GROQ_API_KEY or GROQ_API_KEY == "your_groq_api_key_here":
                 raise ValueError("GROQ_API_KEY not properly configured")
             
+            from langchain_groq import ChatGroq
+            from langchain.schema import HumanMessage, AIMessage
+            
+            _ROLE_TO_CLASS.update(user=HumanMessage, assistant=AIMessage)
+            
             self.llm = ChatGroq(
                 groq_api_key=GROQ_API_KEY,
                 model_name=AI_CONFIG["model"],
@@ -89,10 +97,11 @@ class AIAgent:
         """Set callback for streaming tokens."""
         self.streaming_callback = callback
     
-    def update_screen_context(self, screen_context: ScreenContext):
+    def update_screen_context(self, screen_context: "ScreenContext"):
         """Update current screen context for the agent."""
         self.current_screen_context = screen_context
-        logger.debug(f"Updated screen context: {len(screen_context.text_content)} characters")
+        self._cached_system_msg = None
+        logger.debug("Updated screen context: %d characters", len(screen_context.text_content))
     
     async def process_message(self, user_message: str, include_screen_context: bool = True) -> AsyncGenerator[str, None]:
         """
@@ -105,6 +114,14 @@ class AIAgent:
         Yields:
             Streaming tokens from the AI response
         """
+        # Skip the LLM round-trip for empty or accidental one-character input
+        user_message = user_message.strip()
+        if not user_message:
+            return
+        if len(user_message) < 2:
+            yield "Could you say more?"
+            return
+        
         try:
             # Add user message to history
             self._add_to_history("user", user_message)
@@ -113,7 +130,7 @@ class AIAgent:
             messages = self._prepare_messages(include_screen_context)
             
             # Track response for history
-            response_tokens = []
+            response_buffer = io.StringIO()
             
             # Set up temporary callback
             original_callback = self.streaming_callback
@@ -122,14 +139,15 @@ class AIAgent:
                 # Generate streaming response (without callbacks - not supported by Groq)
                 async for chunk in self.llm.astream(messages):
                     if hasattr(chunk, 'content') and chunk.content:
-                        # Debug: Print each token
-                        logger.debug(f"AI token: '{chunk.content}'")
+                        # Debug: Print each token (guarded, this runs per token)
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug("AI token: '%s'", chunk.content)
                         # Collect token for history
-                        response_tokens.append(chunk.content)
+                        response_buffer.write(chunk.content)
                         yield chunk.content
                 
                 # Add complete response to history
-                full_response = ''.join(response_tokens)
+                full_response = response_buffer.getvalue()
                 # Fix unicode issues in logging
                 try:
                     logger.info(f"AI complete response: {full_response[:100]}...")
@@ -148,60 +166,66 @@ class AIAgent:
             yield error_msg
             self._add_to_history("assistant", error_msg)
     
-    def _handle_token(self, token: str):
-        """Handle individual tokens from streaming response."""
-        if self.streaming_callback:
-            self.streaming_callback(token)
-    
     def _prepare_messages(self, include_screen_context: bool = True) -> List:
         """Prepare message list for the LLM including context and history."""
-        messages = []
+        # Add conversation history (recent messages only); history only ever
+        # holds user/assistant messages, so the final size is known up front
+        history_size = min(len(self.conversation_history), self.max_history)
+        recent_history = itertools.islice(
+            self.conversation_history,
+            len(self.conversation_history) - history_size,
+            None
+        )
+        
+        messages: List = [None] * (history_size + 1)
+        messages[0] = self._get_system_message(include_screen_context)
+        for i, msg in enumerate(recent_history, start=1):
+            messages[i] = _ROLE_TO_CLASS[msg.role](content=msg.content)
+        
+        return messages
+    
+    def _get_system_message(self, include_screen_context: bool = True) -> "SystemMessage":
+        """Get the system message, reusing it while the screen context is unchanged."""
+        context = self.current_screen_context if include_screen_context else None
+        context_id = id(context) if context is not None else None
+        
+        if self._cached_system_msg is not None and context_id == self._cached_ctx_id:
+            return self._cached_system_msg
         
         # System message with persona
         system_content = SYSTEM_MESSAGES["assistant_persona"]
         
         # Add screen context if available and requested
-        if include_screen_context and self.current_screen_context:
-            screen_content = self.current_screen_context.text_content
+        if context is not None:
+            screen_content = context.text_content
             if screen_content.strip():
                 context_prompt = SYSTEM_MESSAGES["screen_context_prompt"].format(
                     screen_content=screen_content[:2000]  # Limit context size
                 )
                 system_content += "\n\n" + context_prompt
         
-        messages.append(SystemMessage(content=system_content))
+        from langchain.schema import SystemMessage
         
-        # Add conversation history (recent messages only)
-        recent_history = self.conversation_history[-self.max_history:]
-        
-        for msg in recent_history:
-            if msg.role == "user":
-                messages.append(HumanMessage(content=msg.content))
-            elif msg.role == "assistant":
-                messages.append(AIMessage(content=msg.content))
-        
-        return messages
+        self._cached_system_msg = SystemMessage(content=system_content)
+        self._cached_ctx_id = context_id
+        return self._cached_system_msg
     
     def _add_to_history(self, role: str, content: str, metadata: Optional[Dict[str, Any]] = None):
         """Add message to conversation history."""
         message = ConversationMessage(
             role=role,
             content=content,
-            timestamp=time.time(),
+            timestamp=time.monotonic_ns(),
             metadata=metadata or {}
         )
         
         self.conversation_history.append(message)
         
-        # Trim history if too long
-        if len(self.conversation_history) > self.max_history * 2:
-            self.conversation_history = self.conversation_history[-self.max_history:]
-        
-        logger.debug(f"Added {role} message to history: {len(content)} characters")
+        logger.debug("Added %s message to history: %d characters", role, len(content))
     
     def get_conversation_history(self) -> List[ConversationMessage]:
         """Get current conversation history."""
-        return self.conversation_history.copy()
+        return list(self.conversation_history)
     
     def clear_conversation(self):
         """Clear conversation history."""
@@ -218,7 +242,17 @@ class AIAgent:
         if not self.current_screen_context or not self.current_screen_context.text_content.strip():
             return None
         
+        # Debounce: requests arriving close together would ask the LLM about
+        # the same screen, so only the first one within the interval is sent
+        now = time.monotonic()
+        if now - self._last_suggestion_time < AI_CONFIG["suggestion_min_interval"]:
+            logger.debug("Skipping proactive suggestion, last request was too recent")
+            return None
+        self._last_suggestion_time = now
+        
         try:
+            from langchain.schema import HumanMessage, SystemMessage
+            
             suggestion_prompt = f"""Based on the current screen content, provide a brief, helpful suggestion or insight (max 50 words):
 
 Screen content: {self.current_screen_context.text_content[:1000]}
@@ -248,7 +282,7 @@ Respond with a single, actionable suggestion or helpful observation. If the cont
             "conversation_length": len(self.conversation_history),
             "has_screen_context": self.current_screen_context is not None,
             "screen_context_age": (
-                time.time() - self.current_screen_context.timestamp 
+                (time.monotonic_ns() - self.current_screen_context.timestamp) / 1e9
                 if self.current_screen_context else None
             ),
             "model": AI_CONFIG["model"],
@@ -258,11 +292,14 @@ Respond with a single, actionable suggestion or helpful observation. If the cont
 
 # Singleton instance
 _ai_agent_instance: Optional[AIAgent] = None
+_ai_agent_lock = threading.Lock()
 
 
 def get_ai_agent() -> AIAgent:
-    """Get the global AI agent instance."""
+    """Get the global AI agent instance (created once, thread-safe)."""
     global _ai_agent_instance
     if _ai_agent_instance is None:
-        _ai_agent_instance = AIAgent()
+        with _ai_agent_lock:
+            if _ai_agent_instance is None:
+                _ai_agent_instance = AIAgent()
     return _ai_agent_instance
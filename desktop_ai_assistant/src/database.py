@@ -8,14 +8,173 @@ import sqlite3
 import aiosqlite
 import time
 import json
-from typing import List, Optional, Dict, Any
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, List, Optional, Dict, Any, Tuple
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 
 from config.settings import DATABASE_CONFIG
 
+try:
+    import orjson
+except ImportError:  # Fall back to the stdlib encoder
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Per-connection tuning: WAL with NORMAL sync avoids an fsync per commit,
+# and the larger cache/mmap keep recent history hot. journal_mode is only
+# set by the writer since read-only connections cannot change it.
+_JOURNAL_PRAGMA = "PRAGMA journal_mode=WAL;"
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-64000;
+    PRAGMA busy_timeout=5000;
+    PRAGMA mmap_size=268435456;
+"""
+
+# SQLite 3.45+ can store metadata as JSONB, a pre-parsed binary form, so
+# json_extract() on it skips re-tokenizing. json() converts it back to text
+# on read and also accepts rows written as plain TEXT by older versions.
+_HAS_JSONB = sqlite3.sqlite_version_info >= (3, 45, 0)
+_METADATA_IN = "jsonb(?)" if _HAS_JSONB else "?"
+_METADATA_OUT = "json(metadata)" if _HAS_JSONB else "metadata"
+
+# Hot statements, built once so every call sends the identical SQL text and
+# hits sqlite3's per-connection statement cache instead of re-preparing
+_SQL_INSERT_CONVERSATION = f"""
+    INSERT INTO conversations
+    (timestamp, user_message, assistant_response, screen_context, metadata, session_id)
+    VALUES (?, ?, ?, ?, {_METADATA_IN}, ?)
+"""
+_SQL_INSERT_SCREEN_CONTEXT = f"""
+    INSERT INTO screen_contexts
+    (timestamp, content, confidence, image_hash, metadata)
+    VALUES (?, ?, ?, ?, {_METADATA_IN})
+"""
+_SQL_SELECT_CONVERSATIONS = f"""
+    SELECT id, timestamp, user_message, assistant_response,
+           screen_context, {_METADATA_OUT}, session_id
+    FROM conversations
+"""
+# Recent history pages by (timestamp, id) keyset; idx_conversations_timestamp
+# implicitly ends in the rowid, so each page is a single backward range scan
+_SQL_RECENT_CONVERSATIONS = _SQL_SELECT_CONVERSATIONS + """
+    ORDER BY timestamp DESC, id DESC LIMIT ?
+"""
+_SQL_RECENT_CONVERSATIONS_BEFORE = _SQL_SELECT_CONVERSATIONS + """
+    WHERE (timestamp, id) < (?, ?)
+    ORDER BY timestamp DESC, id DESC LIMIT ?
+"""
+_SQL_RECENT_SESSION_CONVERSATIONS = _SQL_SELECT_CONVERSATIONS + """
+    WHERE session_id = ?
+    ORDER BY timestamp DESC, id DESC LIMIT ?
+"""
+_SQL_RECENT_SESSION_CONVERSATIONS_BEFORE = _SQL_SELECT_CONVERSATIONS + """
+    WHERE session_id = ? AND (timestamp, id) < (?, ?)
+    ORDER BY timestamp DESC, id DESC LIMIT ?
+"""
+_SQL_SEARCH_CONVERSATIONS = _SQL_SELECT_CONVERSATIONS + """
+    WHERE user_message LIKE ? OR assistant_response LIKE ?
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+_SQL_SEARCH_CONVERSATIONS_FTS = f"""
+    SELECT c.id, c.timestamp, c.user_message, c.assistant_response,
+           c.screen_context, {_METADATA_OUT}, c.session_id
+    FROM conversations_fts f
+    JOIN conversations c ON c.id = f.rowid
+    WHERE conversations_fts MATCH ?
+    ORDER BY f.rank
+    LIMIT ?
+"""
+_SQL_RECENT_SCREEN_CONTEXTS = f"""
+    SELECT id, timestamp, content, confidence, image_hash, {_METADATA_OUT}
+    FROM screen_contexts
+    ORDER BY timestamp DESC
+    LIMIT ?
+"""
+_SQL_SET_PREFERENCE = """
+    INSERT OR REPLACE INTO user_preferences (key, value, updated_at)
+    VALUES (?, ?, CURRENT_TIMESTAMP)
+"""
+_SQL_GET_PREFERENCE = "SELECT value FROM user_preferences WHERE key = ?"
+_SQL_ALL_PREFERENCES = "SELECT key, value FROM user_preferences"
+
+# Row counts for stats. The estimate only reads both ends of the rowid
+# b-tree; it matches COUNT(*) while ids stay contiguous, which is the
+# normal case since cleanup trims the oldest rows first.
+_SQL_COUNT_EXACT = "SELECT COUNT(*) FROM {table}"
+_SQL_COUNT_ESTIMATE = "SELECT COALESCE(MAX(id) - MIN(id) + 1, 0) FROM {table}"
+
+# How long get_database_stats() results are reused, in seconds
+_STATS_TTL = 5.0
+
+# Full-text index over conversations, kept in sync by triggers. It is an
+# external-content table, so the text itself is only stored once.
+_SQL_CREATE_FTS = """
+    CREATE VIRTUAL TABLE conversations_fts USING fts5(
+        user_message, assistant_response,
+        content='conversations', content_rowid='id'
+    );
+    
+    CREATE TRIGGER conversations_fts_insert AFTER INSERT ON conversations BEGIN
+        INSERT INTO conversations_fts(rowid, user_message, assistant_response)
+        VALUES (new.id, new.user_message, new.assistant_response);
+    END;
+    
+    CREATE TRIGGER conversations_fts_delete AFTER DELETE ON conversations BEGIN
+        INSERT INTO conversations_fts(conversations_fts, rowid, user_message, assistant_response)
+        VALUES ('delete', old.id, old.user_message, old.assistant_response);
+    END;
+    
+    CREATE TRIGGER conversations_fts_update AFTER UPDATE ON conversations BEGIN
+        INSERT INTO conversations_fts(conversations_fts, rowid, user_message, assistant_response)
+        VALUES ('delete', old.id, old.user_message, old.assistant_response);
+        INSERT INTO conversations_fts(rowid, user_message, assistant_response)
+        VALUES (new.id, new.user_message, new.assistant_response);
+    END;
+    
+    INSERT INTO conversations_fts(conversations_fts) VALUES ('rebuild');
+"""
+
+
+def _json_dumps(value: Any) -> str:
+    """Serialize to a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value)
+
+
+def _fts_query(query: str) -> str:
+    """Turn free text into an FTS5 prefix query with every term quoted."""
+    terms = query.split()
+    return " ".join('"%s"*' % term.replace('"', '""') for term in terms)
+
+
+def _json_loads(value: str) -> Any:
+    """Parse a JSON string, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(value)
+    return json.loads(value)
+
+
+def _parse_metadata(value: Any) -> Dict[str, Any]:
+    """Parse metadata read back from a row as JSON text; dicts pass through."""
+    if isinstance(value, (str, bytes)):
+        return _json_loads(value) if value else {}
+    return value
+
+
+def _decode_preference(value: str) -> Any:
+    """Decode a stored preference value, keeping plain strings as-is."""
+    try:
+        return _json_loads(value)
+    except json.JSONDecodeError:
+        return value  # Return as string if not JSON
+
 
 @dataclass
 class ConversationRecord:
@@ -25,8 +184,11 @@ class ConversationRecord:
     user_message: str = ""
     assistant_response: str = ""
     screen_context: str = ""
-    metadata: str = "{}"  # JSON string
+    metadata: Dict[str, Any] = field(default_factory=dict)
     session_id: Optional[str] = None
+    
+    def __post_init__(self):
+        self.metadata = _parse_metadata(self.metadata)
 
 
 @dataclass
@@ -37,7 +199,10 @@ class ScreenContextRecord:
     content: str = ""
     confidence: float = 0.0
     image_hash: str = ""
-    metadata: str = "{}"  # JSON string
+    metadata: Dict[str, Any] = field(default_factory=dict)
+    
+    def __post_init__(self):
+        self.metadata = _parse_metadata(self.metadata)
 
 
 class DatabaseManager:
@@ -50,77 +215,258 @@ class DatabaseManager:
         self.max_history = DATABASE_CONFIG["max_history"]
         self.cleanup_interval = DATABASE_CONFIG["cleanup_interval"]
         self.last_cleanup = time.time()
+        self.analyze_interval = DATABASE_CONFIG["analyze_every_n_cleanups"]
+        self._cleanup_count = 0
+        
+        self.reader_pool_size = DATABASE_CONFIG["reader_pool_size"]
+        self.insert_batch_size = DATABASE_CONFIG["insert_batch_size"]
+        self.insert_batch_wait = DATABASE_CONFIG["insert_batch_wait"]
+        
+        # A dedicated writer thread owning a plain sqlite3 connection, plus a
+        # pool of read-only connections. WAL lets readers run alongside the
+        # writer, and the single-thread executor serializes all writes.
+        self._writer: Optional[sqlite3.Connection] = None
+        self._write_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="sage-db-writer"
+        )
+        self._readers: asyncio.Queue = asyncio.Queue()
+        self._has_fts = False
+        
+        # Decoded user preferences, preloaded at startup and written through
+        self._pref_cache: Dict[str, Any] = {}
+        
+        # (time, stats) from the last get_database_stats() call
+        self._stats_cache: Optional[tuple] = None
+        
+        # Buffered conversation inserts, committed in batches by _flush_loop
+        self._insert_queue: asyncio.Queue = asyncio.Queue()
         
         # Ensure database directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # Initialize database
-        asyncio.create_task(self._initialize_database())
+        # Initialization is started by start() on first use and runs once
+        self._init_task: Optional[asyncio.Task] = None
+        self._flusher_task: Optional[asyncio.Task] = None
+        self._ready = asyncio.Event()
+    
+    def start(self):
+        """Schedule database initialization if it has not been started yet."""
+        if self._init_task is None:
+            self._init_task = asyncio.create_task(self._initialize_database())
+            self._flusher_task = asyncio.create_task(self._flush_loop())
+    
+    async def ready(self):
+        """Wait until the database is initialized, starting it if needed."""
+        if self._ready.is_set():
+            return
+        self.start()
+        # Awaiting the task rather than the event surfaces init failures
+        await self._init_task
     
     async def _initialize_database(self):
-        """Initialize database tables if they don't exist."""
+        """Open the connection pool and create tables if they don't exist."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                # Conversations table
-                await db.execute("""
-                    CREATE TABLE IF NOT EXISTS conversations (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        timestamp REAL NOT NULL,
-                        user_message TEXT NOT NULL,
-                        assistant_response TEXT NOT NULL,
-                        screen_context TEXT DEFAULT '',
-                        metadata TEXT DEFAULT '{}',
-                        session_id TEXT,
-                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Screen context table
-                await db.execute("""
-                    CREATE TABLE IF NOT EXISTS screen_contexts (
-                        id INTEGER PRIMARY KEY AUTOINCREMENT,
-                        timestamp REAL NOT NULL,
-                        content TEXT NOT NULL,
-                        confidence REAL DEFAULT 0.0,
-                        image_hash TEXT DEFAULT '',
-                        metadata TEXT DEFAULT '{}',
-                        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # User preferences table
-                await db.execute("""
-                    CREATE TABLE IF NOT EXISTS user_preferences (
-                        key TEXT PRIMARY KEY,
-                        value TEXT NOT NULL,
-                        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                    )
-                """)
-                
-                # Create indexes for better performance
-                await db.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_conversations_timestamp 
-                    ON conversations(timestamp)
-                """)
-                
-                await db.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_screen_contexts_timestamp 
-                    ON screen_contexts(timestamp)
-                """)
-                
-                await db.execute("""
-                    CREATE INDEX IF NOT EXISTS idx_conversations_session 
-                    ON conversations(session_id)
-                """)
-                
-                await db.commit()
-                
+            journal_mode = await self._run_write(self._open_writer)
+            logger.info(f"Database journal mode: {journal_mode}")
+            
+            # Readers are opened after the schema exists since mode=ro
+            # cannot create the database file
+            reader_uri = self.db_path.resolve().as_uri() + "?mode=ro"
+            for _ in range(self.reader_pool_size):
+                reader = await aiosqlite.connect(reader_uri, uri=True)
+                await reader.executescript(_CONNECTION_PRAGMAS)
+                self._readers.put_nowait(reader)
+            
+            self._ready.set()
             logger.info("Database initialized successfully")
             
         except Exception as e:
             logger.error(f"Failed to initialize database: {e}")
             raise
     
+    def _open_writer(self) -> str:
+        """Open the write connection and create the schema (writer thread)."""
+        db = sqlite3.connect(self.db_path, isolation_level="IMMEDIATE")
+        db.executescript(_JOURNAL_PRAGMA + _CONNECTION_PRAGMAS)
+        
+        # Conversations table
+        db.execute("""
+            CREATE TABLE IF NOT EXISTS conversations (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp REAL NOT NULL,
+                user_message TEXT NOT NULL,
+                assistant_response TEXT NOT NULL,
+                screen_context TEXT DEFAULT '',
+                metadata TEXT DEFAULT '{}',
+                session_id TEXT,
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Screen context table
+        db.execute("""
+            CREATE TABLE IF NOT EXISTS screen_contexts (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                timestamp REAL NOT NULL,
+                content TEXT NOT NULL,
+                confidence REAL DEFAULT 0.0,
+                image_hash TEXT DEFAULT '',
+                metadata TEXT DEFAULT '{}',
+                created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # User preferences table
+        db.execute("""
+            CREATE TABLE IF NOT EXISTS user_preferences (
+                key TEXT PRIMARY KEY,
+                value TEXT NOT NULL,
+                updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        
+        # Create indexes for better performance
+        db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_conversations_timestamp
+            ON conversations(timestamp)
+        """)
+        
+        db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_screen_contexts_timestamp
+            ON screen_contexts(timestamp)
+        """)
+        
+        db.execute("""
+            CREATE INDEX IF NOT EXISTS idx_conversations_session
+            ON conversations(session_id)
+        """)
+        
+        db.commit()
+        self._has_fts = self._create_fts(db)
+        
+        # The preferences table is tiny, so load it whole up front
+        self._pref_cache = {
+            key: _decode_preference(value)
+            for key, value in db.execute(_SQL_ALL_PREFERENCES).fetchall()
+        }
+        
+        self._writer = db
+        return db.execute("PRAGMA journal_mode").fetchone()[0]
+    
+    def _create_fts(self, db: sqlite3.Connection) -> bool:
+        """Create the FTS5 search index, falling back to LIKE if unavailable."""
+        exists = db.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = 'conversations_fts'"
+        ).fetchone() is not None
+        
+        if not exists:
+            try:
+                # Creates the index and triggers, then backfills existing rows
+                db.executescript(_SQL_CREATE_FTS)
+            except sqlite3.OperationalError as e:
+                logger.warning(f"FTS5 unavailable, search will use LIKE: {e}")
+                return False
+                
+        return True
+    
+    async def _run_write(self, func: Callable, *args) -> Any:
+        """Run func on the writer thread, which owns the write connection."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._write_executor, func, *args)
+    
+    @asynccontextmanager
+    async def _acquire_reader(self) -> AsyncIterator[aiosqlite.Connection]:
+        """Borrow a read-only connection from the pool."""
+        await self.ready()
+        reader = await self._readers.get()
+        try:
+            yield reader
+        finally:
+            self._readers.put_nowait(reader)
+    
+    async def _flush_loop(self):
+        """Drain buffered conversation inserts in batches."""
+        loop = asyncio.get_running_loop()
+        
+        while True:
+            batch = [await self._insert_queue.get()]
+            deadline = loop.time() + self.insert_batch_wait
+            
+            # Gather more rows until the batch is full or the wait expires
+            while len(batch) < self.insert_batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._insert_queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            
+            try:
+                await self._write_conversation_batch(batch)
+            finally:
+                for _ in batch:
+                    self._insert_queue.task_done()
+    
+    def _insert_conversation_rows(self, rows: List[tuple]) -> List[int]:
+        """Insert conversation rows in one transaction (writer thread)."""
+        db = self._writer
+        try:
+            db.executemany(_SQL_INSERT_CONVERSATION, rows)
+            last_id = db.execute("SELECT last_insert_rowid()").fetchone()[0]
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+            
+        # The writer thread runs one batch at a time, so ids are contiguous
+        first_id = last_id - len(rows) + 1
+        return list(range(first_id, last_id + 1))
+    
+    async def _insert_conversations(self, rows: List[tuple]) -> List[int]:
+        """Insert conversation rows in one transaction and return their IDs."""
+        await self.ready()
+        return await self._run_write(self._insert_conversation_rows, rows)
+    
+    async def _write_conversation_batch(self, batch: List[tuple]):
+        """Insert a batch of buffered conversations in one transaction."""
+        try:
+            record_ids = await self._insert_conversations([row for row, _ in batch])
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        
+        for record_id, (_, future) in zip(record_ids, batch):
+            if not future.done():
+                future.set_result(record_id)
+    
+    async def flush(self):
+        """Wait until all buffered conversation inserts are committed."""
+        await self._insert_queue.join()
+    
+    def _close_writer(self):
+        """Refresh planner statistics and close the write connection (writer thread)."""
+        self._writer.execute("PRAGMA optimize")
+        self._writer.close()
+    
+    async def close(self):
+        """Flush pending inserts and close all connections."""
+        if self._writer is None:
+            return
+        
+        await self.flush()
+        self._flusher_task.cancel()
+        
+        await self._run_write(self._close_writer)
+        self._writer = None
+        self._write_executor.shutdown(wait=False)
+        
+        for _ in range(self.reader_pool_size):
+            reader = await self._readers.get()
+            await reader.close()
+    
     async def save_conversation(
         self,
         user_message: str,
@@ -143,26 +489,23 @@ class DatabaseManager:
             ID of the inserted record
         """
         try:
-            metadata_json = json.dumps(metadata or {})
-            
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute("""
-                    INSERT INTO conversations 
-                    (timestamp, user_message, assistant_response, screen_context, metadata, session_id)
-                    VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    time.time(),
-                    user_message,
-                    assistant_response,
-                    screen_context,
-                    metadata_json,
-                    session_id
-                ))
-                
-                await db.commit()
-                record_id = cursor.lastrowid
-                
-            logger.debug(f"Saved conversation record with ID: {record_id}")
+            metadata_json = _json_dumps(metadata or {})
+            
+            await self.ready()
+            
+            # Queue the row for the batch flusher and wait for its ID
+            future = asyncio.get_running_loop().create_future()
+            await self._insert_queue.put(((
+                time.time(),
+                user_message,
+                assistant_response,
+                screen_context,
+                metadata_json,
+                session_id
+            ), future))
+            record_id = await future
+            
+            logger.debug("Saved conversation record with ID: %s", record_id)
             
             # Perform cleanup if needed
             await self._cleanup_if_needed()
@@ -173,6 +516,50 @@ class DatabaseManager:
             logger.error(f"Failed to save conversation: {e}")
             raise
     
+    async def save_conversations_bulk(self, records: List[ConversationRecord]) -> List[int]:
+        """
+        Save many conversation records in a single transaction.
+        
+        Args:
+            records: Records to insert; their id field is ignored
+            
+        Returns:
+            IDs of the inserted records, in input order
+        """
+        if not records:
+            return []
+            
+        try:
+            now = time.time()
+            rows = [
+                (
+                    record.timestamp or now,
+                    record.user_message,
+                    record.assistant_response,
+                    record.screen_context,
+                    _json_dumps(record.metadata or {}),
+                    record.session_id
+                )
+                for record in records
+            ]
+            
+            record_ids = await self._insert_conversations(rows)
+            logger.debug("Saved %d conversation records", len(record_ids))
+            
+            await self._cleanup_if_needed()
+            
+            return record_ids
+            
+        except Exception as e:
+            logger.error(f"Failed to save conversations: {e}")
+            raise
+    
+    def _insert_screen_context_row(self, row: tuple) -> int:
+        """Insert one screen context row and commit it (writer thread)."""
+        cursor = self._writer.execute(_SQL_INSERT_SCREEN_CONTEXT, row)
+        self._writer.commit()
+        return cursor.lastrowid
+    
     async def save_screen_context(
         self,
         content: str,
@@ -193,25 +580,18 @@ class DatabaseManager:
             ID of the inserted record
         """
         try:
-            metadata_json = json.dumps(metadata or {})
-            
-            async with aiosqlite.connect(self.db_path) as db:
-                cursor = await db.execute("""
-                    INSERT INTO screen_contexts 
-                    (timestamp, content, confidence, image_hash, metadata)
-                    VALUES (?, ?, ?, ?, ?)
-                """, (
-                    time.time(),
-                    content,
-                    confidence,
-                    image_hash,
-                    metadata_json
-                ))
-                
-                await db.commit()
-                record_id = cursor.lastrowid
-                
-            logger.debug(f"Saved screen context record with ID: {record_id}")
+            metadata_json = _json_dumps(metadata or {})
+            
+            await self.ready()
+            record_id = await self._run_write(self._insert_screen_context_row, (
+                time.time(),
+                content,
+                confidence,
+                image_hash,
+                metadata_json
+            ))
+            
+            logger.debug("Saved screen context record with ID: %s", record_id)
             return record_id
             
         except Exception as e:
@@ -221,7 +601,8 @@ class DatabaseManager:
     async def get_recent_conversations(
         self,
         limit: int = 50,
-        session_id: Optional[str] = None
+        session_id: Optional[str] = None,
+        before: Optional[Tuple[float, int]] = None
     ) -> List[ConversationRecord]:
         """
         Get recent conversation records.
@@ -229,43 +610,31 @@ class DatabaseManager:
         Args:
             limit: Maximum number of records to return
             session_id: Filter by session ID if provided
-            
+            before: (timestamp, id) of the last record on the previous page;
+                only older records are returned
+                
         Returns:
             List of ConversationRecord objects
         """
         try:
-            query = """
-                SELECT id, timestamp, user_message, assistant_response, 
-                       screen_context, metadata, session_id
-                FROM conversations
-            """
-            params = []
-            
-            if session_id:
-                query += " WHERE session_id = ?"
-                params.append(session_id)
+            if session_id and before:
+                query = _SQL_RECENT_SESSION_CONVERSATIONS_BEFORE
+                params = (session_id, *before, limit)
+            elif session_id:
+                query = _SQL_RECENT_SESSION_CONVERSATIONS
+                params = (session_id, limit)
+            elif before:
+                query = _SQL_RECENT_CONVERSATIONS_BEFORE
+                params = (*before, limit)
+            else:
+                query = _SQL_RECENT_CONVERSATIONS
+                params = (limit,)
             
-            query += " ORDER BY timestamp DESC LIMIT ?"
-            params.append(limit)
-            
-            async with aiosqlite.connect(self.db_path) as db:
+            async with self._acquire_reader() as db:
                 async with db.execute(query, params) as cursor:
-                    rows = await cursor.fetchall()
-            
-            records = []
-            for row in rows:
-                record = ConversationRecord(
-                    id=row[0],
-                    timestamp=row[1],
-                    user_message=row[2],
-                    assistant_response=row[3],
-                    screen_context=row[4],
-                    metadata=row[5],
-                    session_id=row[6]
-                )
-                records.append(record)
-            
-            return records
+                    # Columns are selected in field order, so records are built
+                    # straight from each row in a single fetch
+                    return [ConversationRecord(*row) for row in await cursor.fetchall()]
             
         except Exception as e:
             logger.error(f"Failed to get recent conversations: {e}")
@@ -282,28 +651,9 @@ class DatabaseManager:
             List of ScreenContextRecord objects
         """
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute("""
-                    SELECT id, timestamp, content, confidence, image_hash, metadata
-                    FROM screen_contexts
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                """, (limit,)) as cursor:
-                    rows = await cursor.fetchall()
-            
-            records = []
-            for row in rows:
-                record = ScreenContextRecord(
-                    id=row[0],
-                    timestamp=row[1],
-                    content=row[2],
-                    confidence=row[3],
-                    image_hash=row[4],
-                    metadata=row[5]
-                )
-                records.append(record)
-            
-            return records
+            async with self._acquire_reader() as db:
+                async with db.execute(_SQL_RECENT_SCREEN_CONTEXTS, (limit,)) as cursor:
+                    return [ScreenContextRecord(*row) for row in await cursor.fetchall()]
             
         except Exception as e:
             logger.error(f"Failed to get recent screen contexts: {e}")
@@ -325,135 +675,161 @@ class DatabaseManager:
             List of matching ConversationRecord objects
         """
         try:
-            search_query = f"%{query}%"
-            
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute("""
-                    SELECT id, timestamp, user_message, assistant_response, 
-                           screen_context, metadata, session_id
-                    FROM conversations
-                    WHERE user_message LIKE ? OR assistant_response LIKE ?
-                    ORDER BY timestamp DESC
-                    LIMIT ?
-                """, (search_query, search_query, limit)) as cursor:
-                    rows = await cursor.fetchall()
-            
-            records = []
-            for row in rows:
-                record = ConversationRecord(
-                    id=row[0],
-                    timestamp=row[1],
-                    user_message=row[2],
-                    assistant_response=row[3],
-                    screen_context=row[4],
-                    metadata=row[5],
-                    session_id=row[6]
-                )
-                records.append(record)
+            fts_query = _fts_query(query) if self._has_fts else ""
             
-            return records
+            if fts_query:
+                sql, params = _SQL_SEARCH_CONVERSATIONS_FTS, (fts_query, limit)
+            else:
+                search_query = f"%{query}%"
+                sql, params = _SQL_SEARCH_CONVERSATIONS, (search_query, search_query, limit)
+                
+            async with self._acquire_reader() as db:
+                async with db.execute(sql, params) as cursor:
+                    return [ConversationRecord(*row) for row in await cursor.fetchall()]
             
         except Exception as e:
             logger.error(f"Failed to search conversations: {e}")
             return []
     
+    def _write_preference(self, key: str, value_str: str):
+        """Upsert one preference row and commit it (writer thread)."""
+        self._writer.execute(_SQL_SET_PREFERENCE, (key, value_str))
+        self._writer.commit()
+    
     async def set_user_preference(self, key: str, value: Any):
         """Set a user preference."""
         try:
-            value_str = json.dumps(value) if not isinstance(value, str) else value
+            value_str = _json_dumps(value) if not isinstance(value, str) else value
+            
+            await self.ready()
+            await self._run_write(self._write_preference, key, value_str)
+            
+            # Cache what a fresh read would return, e.g. "1" comes back as 1
+            self._pref_cache[key] = _decode_preference(value_str)
             
-            async with aiosqlite.connect(self.db_path) as db:
-                await db.execute("""
-                    INSERT OR REPLACE INTO user_preferences (key, value, updated_at)
-                    VALUES (?, ?, CURRENT_TIMESTAMP)
-                """, (key, value_str))
-                
-                await db.commit()
-                
         except Exception as e:
             logger.error(f"Failed to set user preference: {e}")
     
     async def get_user_preference(self, key: str, default: Any = None) -> Any:
         """Get a user preference."""
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                async with db.execute("""
-                    SELECT value FROM user_preferences WHERE key = ?
-                """, (key,)) as cursor:
+            if key in self._pref_cache:
+                return self._pref_cache[key]
+                
+            async with self._acquire_reader() as db:
+                async with db.execute(_SQL_GET_PREFERENCE, (key,)) as cursor:
                     row = await cursor.fetchone()
-            
+                
             if row:
-                try:
-                    return json.loads(row[0])
-                except json.JSONDecodeError:
-                    return row[0]  # Return as string if not JSON
-            
+                value = _decode_preference(row[0])
+                self._pref_cache[key] = value
+                return value
+                
             return default
             
         except Exception as e:
             logger.error(f"Failed to get user preference: {e}")
             return default
     
+    def _delete_old_rows(self):
+        """Trim history beyond the configured limits (writer thread)."""
+        db = self._writer
+        
+        # Both deletes share one transaction, opened as BEGIN IMMEDIATE by
+        # the writer connection. Each seeks the timestamp index to the
+        # oldest row worth keeping and range-deletes everything before it.
+        
+        # Clean up old conversations
+        db.execute("""
+            DELETE FROM conversations 
+            WHERE timestamp < (
+                SELECT timestamp FROM conversations 
+                ORDER BY timestamp DESC 
+                LIMIT 1 OFFSET ?
+            )
+        """, (self.max_history - 1,))
+        
+        # Clean up old screen contexts (keep more for analysis)
+        db.execute("""
+            DELETE FROM screen_contexts 
+            WHERE timestamp < (
+                SELECT timestamp FROM screen_contexts 
+                ORDER BY timestamp DESC 
+                LIMIT 1 OFFSET ?
+            )
+        """, (self.max_history * 2 - 1,))
+        
+        db.commit()
+        
+        # Fold the deleted pages back into the main file so the WAL
+        # does not keep growing between cleanups
+        db.execute("PRAGMA wal_checkpoint(PASSIVE)")
+        
+        # Periodically rebuild planner statistics so the timestamp and FTS
+        # indexes keep getting picked as the tables grow
+        self._cleanup_count += 1
+        if self._cleanup_count % self.analyze_interval == 0:
+            db.execute("ANALYZE conversations")
+            db.execute("ANALYZE screen_contexts")
+    
     async def _cleanup_if_needed(self):
         """Perform database cleanup if needed."""
         current_time = time.time()
         
         if current_time - self.last_cleanup < self.cleanup_interval:
             return
-        
+            
         try:
-            async with aiosqlite.connect(self.db_path) as db:
-                # Clean up old conversations
-                await db.execute("""
-                    DELETE FROM conversations 
-                    WHERE id NOT IN (
-                        SELECT id FROM conversations 
-                        ORDER BY timestamp DESC 
-                        LIMIT ?
-                    )
-                """, (self.max_history,))
-                
-                # Clean up old screen contexts (keep more for analysis)
-                await db.execute("""
-                    DELETE FROM screen_contexts 
-                    WHERE id NOT IN (
-                        SELECT id FROM screen_contexts 
-                        ORDER BY timestamp DESC 
-                        LIMIT ?
-                    )
-                """, (self.max_history * 2,))
-                
-                await db.commit()
-                
+            await self.ready()
+            await self._run_write(self._delete_old_rows)
+            
             self.last_cleanup = current_time
             logger.debug("Database cleanup completed")
             
         except Exception as e:
             logger.error(f"Database cleanup failed: {e}")
     
-    async def get_database_stats(self) -> Dict[str, Any]:
-        """Get database statistics."""
+    async def get_database_stats(self, exact: bool = False) -> Dict[str, Any]:
+        """
+        Get database statistics.
+        
+        Args:
+            exact: Run COUNT(*) scans instead of the O(1) rowid estimate and
+                bypass the short-lived stats cache
+                
+        Returns:
+            Dictionary of row counts, file size and last cleanup time
+        """
+        now = time.time()
+        if not exact and self._stats_cache and now - self._stats_cache[0] < _STATS_TTL:
+            return dict(self._stats_cache[1])
+            
         try:
-            async with aiosqlite.connect(self.db_path) as db:
+            count_sql = _SQL_COUNT_EXACT if exact else _SQL_COUNT_ESTIMATE
+            
+            async with self._acquire_reader() as db:
                 # Count conversations
-                async with db.execute("SELECT COUNT(*) FROM conversations") as cursor:
+                async with db.execute(count_sql.format(table="conversations")) as cursor:
                     conversation_count = (await cursor.fetchone())[0]
-                
+                    
                 # Count screen contexts
-                async with db.execute("SELECT COUNT(*) FROM screen_contexts") as cursor:
+                async with db.execute(count_sql.format(table="screen_contexts")) as cursor:
                     context_count = (await cursor.fetchone())[0]
                 
-                # Get database size
-                db_size = self.db_path.stat().st_size if self.db_path.exists() else 0
-                
-                return {
-                    "conversation_count": conversation_count,
-                    "screen_context_count": context_count,
-                    "database_size_bytes": db_size,
-                    "database_size_mb": round(db_size / (1024 * 1024), 2),
-                    "last_cleanup": self.last_cleanup
-                }
-                
+            # Get database size
+            db_size = self.db_path.stat().st_size if self.db_path.exists() else 0
+            
+            stats = {
+                "conversation_count": conversation_count,
+                "screen_context_count": context_count,
+                "database_size_bytes": db_size,
+                "database_size_mb": round(db_size / (1024 * 1024), 2),
+                "last_cleanup": self.last_cleanup
+            }
+            
+            self._stats_cache = (now, stats)
+            return dict(stats)
+            
         except Exception as e:
             logger.error(f"Failed to get database stats: {e}")
             return {}
@@ -464,8 +840,15 @@ _database_manager_instance: Optional[DatabaseManager] = None
 
 
 def get_database_manager() -> DatabaseManager:
-    """Get the global database manager instance."""
+    """Get the global database manager instance (initialized on first use)."""
     global _database_manager_instance
     if _database_manager_instance is None:
         _database_manager_instance = DatabaseManager()
     return _database_manager_instance
+
+
+async def get_database_manager_async() -> DatabaseManager:
+    """Get the global database manager instance once it is initialized."""
+    manager = get_database_manager()
+    await manager.ready()
+    return manager
@@ -10,6 +10,23 @@ import asyncio
 logger = logging.getLogger(__name__)
 
 
+def _log_exception(func_name: str, error: Exception, seen_types: set):
+    """
+    Log an exception caught by a decorator.
+    
+    The first occurrence of each exception type per decorated function is
+    logged with its traceback; repeats are downgraded to a one-line debug
+    message so tight loops don't pay for traceback formatting every time.
+    """
+    error_type = type(error)
+    if error_type in seen_types:
+        logger.debug("Repeated exception in %s: %s", func_name, error)
+        return
+        
+    seen_types.add(error_type)
+    logger.error("Exception in %s: %s", func_name, error, exc_info=True)
+
+
 def handle_exceptions(
     default_return: Any = None,
     log_errors: bool = True,
@@ -26,16 +43,15 @@ def handle_exceptions(
         exception_types: Tuple of exception types to catch
     """
     def decorator(func: Callable) -> Callable:
+        seen_types = set()
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             try:
                 return func(*args, **kwargs)
             except exception_types as e:
                 if log_errors:
-                    logger.error(
-                        f"Exception in {func.__name__}: {e}",
-                        exc_info=True
-                    )
+                    _log_exception(func.__name__, e, seen_types)
                 if reraise:
                     raise
                 return default_return
@@ -53,16 +69,15 @@ def handle_async_exceptions(
     Decorator for handling exceptions in async functions.
     """
     def decorator(func: Callable) -> Callable:
+        seen_types = set()
+        
         @functools.wraps(func)
         async def wrapper(*args, **kwargs):
             try:
                 return await func(*args, **kwargs)
             except exception_types as e:
                 if log_errors:
-                    logger.error(
-                        f"Exception in {func.__name__}: {e}",
-                        exc_info=True
-                    )
+                    _log_exception(func.__name__, e, seen_types)
                 if reraise:
                     raise
                 return default_return
@@ -1,15 +1,43 @@
 """
 Logging configuration for the SAGE Desktop AI Assistant.
 """
+import atexit
 import logging
 import logging.handlers
+import queue
 import sys
 from pathlib import Path
+from typing import Optional
 from config.settings import LOGGING_CONFIG
 
+# Background listener that writes queued records to the real handlers
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+def _stop_queue_listener():
+    """Flush queued records and stop the background listener."""
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 def setup_logging():
-    """Configure logging for the application."""
+    """
+    Configure logging for the application.
     
+    Loggers only enqueue records; console and file output happen on a
+    QueueListener thread so callers (including the event loop) never block
+    on disk I/O. Calling it again is a no-op, so handlers are never added
+    twice.
+    """
+    global _queue_listener
+    
+    if _queue_listener is not None:
+        return
+        
     # Create logs directory if it doesn't exist
     log_file = Path(LOGGING_CONFIG["file"])
     log_file.parent.mkdir(parents=True, exist_ok=True)
@@ -36,8 +64,6 @@ def setup_logging():
         except Exception:
             pass  # Fallback for older Python versions
     
-    root_logger.addHandler(console_handler)
-    
     # File handler with rotation and UTF-8 encoding
     file_handler = logging.handlers.RotatingFileHandler(
         log_file,
@@ -48,7 +74,17 @@ def setup_logging():
     )
     file_handler.setLevel(getattr(logging, LOGGING_CONFIG["level"]))
     file_handler.setFormatter(formatter)
-    root_logger.addHandler(file_handler)
+    
+    # Route records through a queue to the handlers above
+    log_queue = queue.Queue(-1)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue,
+        console_handler,
+        file_handler,
+        respect_handler_level=True
+    )
+    _queue_listener.start()
     
     # Set third-party loggers to WARNING level to reduce noise
     logging.getLogger("urllib3").setLevel(logging.WARNING)
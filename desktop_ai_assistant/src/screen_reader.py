@@ -3,31 +3,99 @@ Screen reader module for capturing and processing screen content.
 Provides OCR capabilities using KerasOCR and context extraction for the AI assistant.
 """
 import asyncio
+import functools
+import hashlib
 import logging
 import time
-from typing import Optional, Tuple, Dict, Any, List
+from typing import Optional, Tuple, Dict, Any, List, Callable
 import cv2
 import numpy as np
 import mss
-import keras_ocr
-from PIL import Image, ImageEnhance, ImageFilter
 import threading
 from dataclasses import dataclass
 import os
+import queue
 
 from config.settings import SCREEN_CONFIG, AI_CONFIG
 
+try:
+    import xxhash
+except ImportError:  # Fall back to the stdlib hasher
+    xxhash = None
+
+try:
+    import dxcam  # Windows-only DXGI Desktop Duplication capture
+except ImportError:  # Fall back to mss
+    dxcam = None
+
 logger = logging.getLogger(__name__)
 
+# Number of set bits in each byte value, for Hamming distances over packed hashes
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+# OCR confidence adjustment indexed by a 4-bit feature mask:
+# 1 = has letters, 2 = letters and digits, 4 = has spaces, 8 = over 30% special chars
+_CONFIDENCE_DELTA = np.array([
+    0.1 * bool(flags & 1) + 0.1 * bool(flags & 2) + 0.05 * bool(flags & 4) - 0.2 * bool(flags & 8)
+    for flags in range(16)
+])
+
+# Most word crops sent to the recognizer in one batch
+_RECOGNIZER_MAX_BATCH = 128
+
 
 @dataclass
 class ScreenContext:
     """Container for screen context data."""
     text_content: str
-    timestamp: float
+    timestamp: int  # time.monotonic_ns() at capture
     confidence: float
     region: Optional[Tuple[int, int, int, int]] = None
-    image_hash: Optional[str] = None
+    image_hash: Optional[str] = None  # Perceptual dHash
+    frame_digest: Optional[str] = None  # Exact hash of the captured pixels
+
+
+def _configure_tensorflow_threads():
+    """
+    Size TensorFlow's CPU thread pools to the physical core count.
+    
+    By default TF sizes its intra-op pool by logical CPUs, so hyperthreads
+    oversubscribe the cores during OCR inference.
+    """
+    import psutil
+    import tensorflow as tf
+    
+    physical_cores = psutil.cpu_count(logical=False) or os.cpu_count() or 1
+    try:
+        tf.config.threading.set_intra_op_parallelism_threads(physical_cores)
+        tf.config.threading.set_inter_op_parallelism_threads(1)
+    except RuntimeError as e:
+        # Thread pools are fixed once the TF runtime has started
+        logger.debug(f"TensorFlow threading already configured: {e}")
+
+
+@functools.lru_cache(maxsize=1)
+def get_pipeline():
+    """
+    Get the shared KerasOCR pipeline, building it on first use.
+    
+    Importing keras_ocr loads TensorFlow and building the pipeline loads
+    the detector/recognizer weights, so this is deferred until OCR is needed.
+    """
+    # Set cache directory if specified
+    if SCREEN_CONFIG.get("model_cache_dir"):
+        os.environ['KERAS_OCR_CACHE_DIR'] = SCREEN_CONFIG["model_cache_dir"]
+    
+    # Must be set before TensorFlow is first imported
+    os.environ.setdefault("TF_ENABLE_ONEDNN_OPTS", "1")
+    os.environ.setdefault("TF_CPP_MIN_LOG_LEVEL", "2")
+    
+    import keras_ocr
+    
+    _configure_tensorflow_threads()
+    
+    # This will download models on first run (~200MB)
+    return keras_ocr.pipeline.Pipeline()
 
 
 class ScreenReader:
@@ -38,86 +106,191 @@ class ScreenReader:
     def __init__(self):
         self.is_running = False
         self.capture_interval = AI_CONFIG["screen_capture_interval"]
+        self.max_capture_interval = AI_CONFIG.get("screen_capture_max_interval", self.capture_interval)
         self.last_context: Optional[ScreenContext] = None
         self.capture_thread: Optional[threading.Thread] = None
-        self.context_callbacks = []
+        self.ocr_thread: Optional[threading.Thread] = None
+        self.context_callbacks: Tuple[Callable[[ScreenContext], None], ...] = ()
         self._lock = threading.Lock()
         
-        # Initialize KerasOCR pipeline
-        self.ocr_pipeline = None
-        self._initialize_ocr()
+        # Hand-off between the capture and OCR threads; holds only the newest frame
+        self._frame_q: "queue.Queue[Tuple[int, str, str, np.ndarray]]" = queue.Queue(maxsize=1)
+        self._stop_event = threading.Event()
+        
+        # Per-thread scratch state (capture and force_capture may run concurrently)
+        self._tls = threading.local()
+        
+        # KerasOCR pipeline, initialized lazily on the first capture
+        self._ocr_pipeline = None
+        self._ocr_init_failed = False
+        self._ocr_lock = threading.Lock()
+        
+        # Screen config, read once instead of on every frame
+        self._capture_region = SCREEN_CONFIG.get("capture_region")
+        self._do_preprocess = SCREEN_CONFIG.get("preprocessing", True)
+        self._max_dimension = SCREEN_CONFIG.get("max_dimension", 1920)
+        self._conf_threshold = SCREEN_CONFIG["ocr_confidence_threshold"]
+        self._hash_threshold = SCREEN_CONFIG.get("hash_distance_threshold", 5)
+        self._capture_monitor: Optional[Dict[str, int]] = None
+        if self._capture_region:
+            self._capture_monitor = {
+                "top": self._capture_region[1],
+                "left": self._capture_region[0],
+                "width": self._capture_region[2],
+                "height": self._capture_region[3]
+            }
+        
+        # DXGI capture on Windows when dxcam is installed; disabled after a failure
+        self._use_dxcam = dxcam is not None
+        self._dxcam = None
+        self._dxcam_frame: Optional[np.ndarray] = None
+        self._dxcam_lock = threading.Lock()
+        
+        # Per-tile dHashes and recognized words, so only changed tiles are re-OCR'd
+        self._tile_grid = SCREEN_CONFIG.get("ocr_tile_grid", 8)
+        self._tile_hashes: Optional[np.ndarray] = None
+        self._tile_words: Dict[Tuple[int, int], List[str]] = {}
+        self._tile_lock = threading.Lock()
+    
+    @property
+    def ocr_pipeline(self):
+        """KerasOCR pipeline, initialized on first access."""
+        if self._ocr_pipeline is None and not self._ocr_init_failed:
+            with self._ocr_lock:
+                if self._ocr_pipeline is None and not self._ocr_init_failed:
+                    self._initialize_ocr()
+        return self._ocr_pipeline
     
     def _initialize_ocr(self):
         """Initialize KerasOCR pipeline."""
         try:
             logger.info("Initializing KerasOCR pipeline...")
-            
-            # Set cache directory if specified
-            if SCREEN_CONFIG.get("model_cache_dir"):
-                os.environ['KERAS_OCR_CACHE_DIR'] = SCREEN_CONFIG["model_cache_dir"]
-            
-            # Initialize KerasOCR pipeline
-            # This will download models on first run (~200MB)
-            self.ocr_pipeline = keras_ocr.pipeline.Pipeline()
-            
+            self._ocr_pipeline = get_pipeline()
             logger.info("KerasOCR pipeline initialized successfully")
             
         except Exception as e:
             logger.error(f"Failed to initialize KerasOCR: {e}")
             logger.warning("OCR functionality will be limited")
-            self.ocr_pipeline = None
+            self._ocr_pipeline = None
+            self._ocr_init_failed = True
     
     def add_context_callback(self, callback):
         """Add a callback to be called when new screen context is available."""
-        self.context_callbacks.append(callback)
+        # Copy-on-write: the monitor thread iterates whatever tuple it last read
+        with self._lock:
+            self.context_callbacks = self.context_callbacks + (callback,)
     
     def remove_context_callback(self, callback):
         """Remove a context callback."""
-        if callback in self.context_callbacks:
-            self.context_callbacks.remove(callback)
+        with self._lock:
+            self.context_callbacks = tuple(
+                cb for cb in self.context_callbacks if cb != callback
+            )
     
     def start_monitoring(self):
         """Start continuous screen monitoring."""
         if self.is_running:
             return
         
-        if not self.ocr_pipeline:
+        if self._ocr_init_failed:
             logger.warning("OCR pipeline not available, screen monitoring disabled")
             return
         
         self.is_running = True
-        self.capture_thread = threading.Thread(target=self._monitor_loop, daemon=True)
-        self.capture_thread.start()
+        self._stop_event.clear()
+        self.ocr_thread = threading.Thread(target=self._monitor_loop, daemon=True)
+        self.ocr_thread.start()
         logger.info("Screen monitoring started")
     
     def stop_monitoring(self):
         """Stop screen monitoring."""
         self.is_running = False
-        if self.capture_thread and self.capture_thread.is_alive():
-            self.capture_thread.join(timeout=2.0)
+        self._stop_event.set()
+        for thread in (self.capture_thread, self.ocr_thread):
+            if thread and thread.is_alive():
+                thread.join(timeout=2.0)
         logger.info("Screen monitoring stopped")
     
+    def _capture_loop(self):
+        """
+        Capture and preprocess frames in a separate thread.
+        
+        Runs ahead of the OCR thread so frame N+1 is captured while frame N
+        is being recognized. Only the newest frame is kept for OCR.
+        
+        Captures are scheduled against a monotonic deadline, so time spent
+        capturing counts towards the interval. While consecutive frames stay
+        within the hash threshold the interval doubles, up to
+        max_capture_interval, and it resets on the first change.
+        """
+        interval = self.capture_interval
+        last_hash: Optional[str] = None
+        
+        while not self._stop_event.is_set():
+            deadline = time.monotonic() + interval
+            try:
+                frame = self._capture_frame()
+                if frame is not None:
+                    # Back off while the screen is idle
+                    image_hash = frame[1]
+                    if (last_hash is not None
+                            and self._hash_distance(image_hash, last_hash) <= self._hash_threshold):
+                        interval = min(interval * 2, self.max_capture_interval)
+                    else:
+                        interval = self.capture_interval
+                    last_hash = image_hash
+                    
+                    try:
+                        self._frame_q.put_nowait(frame)
+                    except queue.Full:
+                        # Drop the stale frame the OCR thread has not picked up yet
+                        try:
+                            self._frame_q.get_nowait()
+                        except queue.Empty:
+                            pass
+                        self._frame_q.put_nowait(frame)
+                
+                self._stop_event.wait(max(0.0, deadline - time.monotonic()))
+                
+            except Exception as e:
+                logger.error(f"Error in screen capture loop: {e}")
+                self._stop_event.wait(1.0)  # Brief pause before retrying
+        
+        self._close_sct()
+    
     def _monitor_loop(self):
-        """Main monitoring loop running in a separate thread."""
+        """Main monitoring loop, running OCR on captured frames in a separate thread."""
+        # Load the OCR pipeline here rather than on the UI thread at startup
+        if not self.ocr_pipeline:
+            logger.warning("OCR pipeline not available, screen monitoring disabled")
+            self.is_running = False
+            return
+        
+        self.capture_thread = threading.Thread(target=self._capture_loop, daemon=True)
+        self.capture_thread.start()
+        
         while self.is_running:
             try:
-                context = self.capture_screen_context()
+                try:
+                    frame = self._frame_q.get(timeout=1.0)
+                except queue.Empty:
+                    continue
+                
+                context = self._build_context(frame)
                 if context and self._is_context_changed(context):
                     with self._lock:
                         self.last_context = context
                     
-                    # Notify callbacks
+                    # Notify callbacks (snapshot, safe against concurrent add/remove)
                     for callback in self.context_callbacks:
                         try:
                             callback(context)
                         except Exception as e:
                             logger.error(f"Error in context callback: {e}")
                 
-                time.sleep(self.capture_interval)
-                
             except Exception as e:
                 logger.error(f"Error in screen monitoring loop: {e}")
-                time.sleep(1.0)  # Brief pause before retrying
+                self._stop_event.wait(1.0)  # Brief pause before retrying
     
     def capture_screen_context(self) -> Optional[ScreenContext]:
         """
@@ -128,31 +301,71 @@ class ScreenReader:
         """
         if not self.ocr_pipeline:
             return None
-            
+        
+        try:
+            frame = self._capture_frame()
+        finally:
+            # One-off captures run on caller threads (GUI, executors) that may
+            # never capture again; don't leave their display handle open
+            self._close_sct()
+        if frame is None:
+            return None
+        
+        return self._build_context(frame)
+    
+    def _capture_frame(self) -> Optional[Tuple[int, str, str, np.ndarray]]:
+        """
+        Capture and preprocess the screen, without running OCR.
+        
+        Returns:
+            Tuple of (timestamp, image_hash, frame_digest, preprocessed image)
+            or None if capture failed
+        """
         try:
             # Capture screen
             screenshot = self._capture_screen()
             if screenshot is None:
                 return None
             
+            timestamp = time.monotonic_ns()
+            image_hash = self._calculate_image_hash(screenshot)
+            frame_digest = self._calculate_frame_digest(screenshot)
+            
             # Preprocess image for better OCR
             processed_image = self._preprocess_image(screenshot)
             
+            return timestamp, image_hash, frame_digest, processed_image
+            
+        except Exception as e:
+            logger.error(f"Failed to capture screen: {e}")
+            return None
+    
+    def _build_context(self, frame: Tuple[int, str, str, np.ndarray]) -> Optional[ScreenContext]:
+        """
+        Run OCR on a captured frame and wrap the result.
+        
+        Returns:
+            ScreenContext object or None if OCR failed or confidence was too low
+        """
+        timestamp, image_hash, frame_digest, processed_image = frame
+        
+        try:
             # Perform OCR
             text_content, confidence = self._extract_text_keras(processed_image)
             
             # Filter based on confidence threshold
-            if confidence < SCREEN_CONFIG["ocr_confidence_threshold"]:
+            if confidence < self._conf_threshold:
                 logger.debug(f"OCR confidence too low: {confidence}")
                 return None
             
             # Create context object
             context = ScreenContext(
                 text_content=text_content,
-                timestamp=time.time(),
+                timestamp=timestamp,
                 confidence=confidence,
-                region=SCREEN_CONFIG.get("capture_region"),
-                image_hash=self._calculate_image_hash(screenshot)
+                region=self._capture_region,
+                image_hash=image_hash,
+                frame_digest=frame_digest
             )
             
             return context
@@ -161,88 +374,149 @@ class ScreenReader:
             logger.error(f"Failed to capture screen context: {e}")
             return None
     
-    def _capture_screen(self) -> Optional[Image.Image]:
-        """Capture screenshot using mss."""
-        try:
-            # Create new MSS instance for thread safety
-            with mss.mss() as sct:
-                # Determine capture region
-                region = SCREEN_CONFIG.get("capture_region")
-                if region:
-                    monitor = {
-                        "top": region[1],
-                        "left": region[0],
-                        "width": region[2],
-                        "height": region[3]
-                    }
-                else:
-                    monitor = sct.monitors[1]  # Primary monitor
-                
-                # Capture screenshot
-                screenshot = sct.grab(monitor)
-                
-                # Convert to PIL Image
-                img = Image.frombytes("RGB", screenshot.size, screenshot.rgb)
+    def _capture_screen(self) -> Optional[np.ndarray]:
+        """Capture screenshot using dxcam or mss as a BGRA numpy array."""
+        if self._use_dxcam:
+            img = self._grab_dxcam()
+            if img is not None:
                 return img
+        
+        try:
+            # MSS instances are not thread-safe, so each thread keeps its own
+            sct = getattr(self._tls, "sct", None)
+            if sct is None:
+                sct = self._tls.sct = mss.mss()
+            
+            # Determine capture region
+            monitor = self._capture_monitor or sct.monitors[1]  # Primary monitor
+            
+            # Capture screenshot
+            screenshot = sct.grab(monitor)
+            
+            # Wrap the raw BGRA buffer without copying it
+            img = np.frombuffer(screenshot.raw, dtype=np.uint8)
+            return img.reshape(screenshot.height, screenshot.width, 4)
             
         except Exception as e:
             logger.error(f"Failed to capture screen: {e}")
+            # Reopen the display connection on the next capture
+            self._close_sct()
             return None
     
-    def _preprocess_image(self, image: Image.Image) -> np.ndarray:
+    def _grab_dxcam(self) -> Optional[np.ndarray]:
+        """
+        Capture screenshot via DXGI Desktop Duplication.
+        
+        dxcam returns None when the screen has not changed since its last grab,
+        in which case the previous frame is returned again.
+        """
+        with self._dxcam_lock:
+            try:
+                if self._dxcam is None:
+                    self._dxcam = dxcam.create(output_color="BGRA")
+                
+                region = None
+                if self._capture_region:
+                    left, top, width, height = self._capture_region
+                    region = (left, top, left + width, top + height)
+                
+                img = self._dxcam.grab(region=region)
+                if img is not None:
+                    self._dxcam_frame = img
+                return self._dxcam_frame
+                
+            except Exception as e:
+                logger.warning(f"dxcam capture failed, falling back to mss: {e}")
+                self._use_dxcam = False
+                return None
+    
+    def _close_sct(self):
+        """Close the calling thread's MSS instance, if it has one."""
+        sct = getattr(self._tls, "sct", None)
+        if sct is not None:
+            self._tls.sct = None
+            try:
+                sct.close()
+            except Exception as e:
+                logger.debug(f"Error closing MSS instance: {e}")
+    
+    def _preprocess_image(self, image: np.ndarray) -> np.ndarray:
         """
         Preprocess image for better OCR results.
         
         Args:
-            image: PIL Image to preprocess
+            image: BGRA numpy array from _capture_screen
             
         Returns:
-            Preprocessed numpy array (BGR format for KerasOCR)
+            Preprocessed numpy array (RGB format for KerasOCR)
         """
         try:
-            if not SCREEN_CONFIG.get("preprocessing", True):
-                # Convert PIL to numpy array (RGB to BGR for OpenCV/KerasOCR)
-                return cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
-            
-            # Convert to numpy array
-            img_array = np.array(image)
-            
-            # Convert RGB to BGR for OpenCV operations
-            img_bgr = cv2.cvtColor(img_array, cv2.COLOR_RGB2BGR)
-            
-            # Resize if image is too large (for performance)
-            height, width = img_bgr.shape[:2]
-            max_dimension = 1920  # Max width or height
-            
-            if max(height, width) > max_dimension:
-                scale = max_dimension / max(height, width)
-                new_width = int(width * scale)
-                new_height = int(height * scale)
-                img_bgr = cv2.resize(img_bgr, (new_width, new_height), interpolation=cv2.INTER_AREA)
-            
-            # Optional: Apply some preprocessing for better OCR
-            # Convert to grayscale for noise reduction, then back to BGR
-            gray = cv2.cvtColor(img_bgr, cv2.COLOR_BGR2GRAY)
-            
-            # Apply slight Gaussian blur to reduce noise
-            gray = cv2.GaussianBlur(gray, (3, 3), 0)
-            
-            # Convert back to BGR (KerasOCR expects 3-channel image)
-            img_bgr = cv2.cvtColor(gray, cv2.COLOR_GRAY2BGR)
-            
-            return img_bgr
+            if not self._do_preprocess:
+                # KerasOCR expects RGB format
+                return cv2.cvtColor(image, cv2.COLOR_BGRA2RGB)
+            
+            # Convert straight from BGRA to grayscale in one pass, then resize
+            # the single channel if the image is too large (for performance).
+            # No blur, CRAFT relies on sharp glyph edges.
+            height, width = image.shape[:2]
+            plan = self._resize_plan(height, width)
+            
+            if plan is None:
+                gray = cv2.cvtColor(image, cv2.COLOR_BGRA2GRAY)
+            else:
+                # The full-size gray is scratch; the resized output is a fresh
+                # array since queued frames must not share memory
+                scratch, target_size = plan
+                cv2.cvtColor(image, cv2.COLOR_BGRA2GRAY, dst=scratch)
+                gray = cv2.resize(scratch, target_size, interpolation=cv2.INTER_AREA)
+            
+            # KerasOCR expects 3 channels; replicate gray as a zero-copy view
+            return np.broadcast_to(gray[:, :, None], gray.shape + (3,))
             
         except Exception as e:
             logger.error(f"Error preprocessing image: {e}")
-            # Fallback: just convert PIL to numpy BGR
-            return cv2.cvtColor(np.array(image), cv2.COLOR_RGB2BGR)
+            # Fallback: just drop the alpha channel
+            return cv2.cvtColor(image, cv2.COLOR_BGRA2RGB)
+    
+    def _resize_plan(self, height: int, width: int) -> Optional[Tuple[np.ndarray, Tuple[int, int]]]:
+        """
+        Get this thread's resize plan for a capture shape.
+        
+        The target size depends only on the capture shape, so it is worked out
+        once per shape along with a full-size gray scratch array that is reused
+        for every later frame.
+        
+        Returns:
+            Tuple of (gray scratch array, (new_width, new_height)), or None if
+            no resize is needed
+        """
+        plans = getattr(self._tls, "resize_plans", None)
+        if plans is None:
+            plans = self._tls.resize_plans = {}
+        
+        key = (height, width)
+        if key not in plans:
+            if max(height, width) > self._max_dimension:
+                scale = self._max_dimension / max(height, width)
+                new_width = int(width * scale)
+                new_height = int(height * scale)
+                scratch = np.empty((height, width), dtype=np.uint8)
+                plans[key] = (scratch, (new_width, new_height))
+            else:
+                plans[key] = None
+        
+        return plans[key]
     
     def _extract_text_keras(self, image: np.ndarray) -> Tuple[str, float]:
         """
         Extract text from image using KerasOCR.
         
+        The frame is split into a grid of tiles with one dHash each. Only the
+        bounding rect of tiles that changed since the previous frame (plus a
+        one-tile halo) is run through OCR; other tiles keep their words.
+        
         Args:
-            image: numpy array in BGR format
+            image: numpy array in RGB format, as returned by _preprocess_image
             
         Returns:
             Tuple of (extracted_text, confidence_score)
@@ -251,33 +525,62 @@ class ScreenReader:
             if not self.ocr_pipeline:
                 return "", 0.0
             
-            # KerasOCR expects RGB format
-            image_rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+            grid = self._tile_grid
+            height, width = image.shape[:2]
             
-            # Run OCR
-            predictions = self.ocr_pipeline.recognize([image_rgb])
-            
-            if not predictions or not predictions[0]:
-                return "", 0.0
-            
-            # Extract text and confidence scores
-            texts = []
-            confidences = []
-            
-            for text, bbox in predictions[0]:
-                if text.strip():  # Only add non-empty text
-                    texts.append(text.strip())
-                    # KerasOCR doesn't provide confidence scores directly
-                    # We'll estimate based on text length and character variety
-                    confidence = self._estimate_text_confidence(text)
-                    confidences.append(confidence)
+            with self._tile_lock:
+                tile_hashes = self._calculate_tile_hashes(image[:, :, 1])
+                if self._tile_hashes is None:
+                    changed = np.ones((grid, grid), dtype=bool)
+                    self._tile_hashes = tile_hashes.copy()
+                else:
+                    distance = _POPCOUNT[tile_hashes ^ self._tile_hashes].sum(axis=-1)
+                    changed = distance > self._hash_threshold
+                
+                if changed.any():
+                    rows, cols = np.nonzero(changed)
+                    top, bottom = rows.min(), rows.max() + 1
+                    left, right = cols.min(), cols.max() + 1
+                    
+                    # Only re-OCR'd tiles get a new reference hash; the rest keep
+                    # the one from their last OCR so slow drift still adds up
+                    self._tile_hashes[top:bottom, left:right] = tile_hashes[top:bottom, left:right]
+                    
+                    # OCR the changed rect plus a halo so words crossing its edge stay whole
+                    y0 = max(top - 1, 0) * height // grid
+                    y1 = min(bottom + 1, grid) * height // grid
+                    x0 = max(left - 1, 0) * width // grid
+                    x1 = min(right + 1, grid) * width // grid
+                    words, centers = self._extract_words_keras(image[y0:y1, x0:x1])
+                    
+                    # Replace the words of the changed rect; halo tiles keep theirs
+                    for tile in list(self._tile_words):
+                        if top <= tile[0] < bottom and left <= tile[1] < right:
+                            del self._tile_words[tile]
+                    
+                    for word, (cx, cy) in zip(words, centers):
+                        row = min(int((cy + y0) * grid / height), grid - 1)
+                        col = min(int((cx + x0) * grid / width), grid - 1)
+                        if top <= row < bottom and left <= col < right:
+                            self._tile_words.setdefault((row, col), []).append(word)
+                
+                # Reassemble in reading order (row-major over tiles)
+                texts = [
+                    word
+                    for tile in sorted(self._tile_words)
+                    for word in self._tile_words[tile]
+                ]
             
             if not texts:
                 return "", 0.0
             
+            # KerasOCR doesn't provide confidence scores directly
+            # We'll estimate based on text length and character variety
+            confidences = self._estimate_confidence_batch(texts)
+            
             # Combine texts and calculate average confidence
             combined_text = ' '.join(texts)
-            avg_confidence = sum(confidences) / len(confidences) if confidences else 0.0
+            avg_confidence = float(confidences.mean())
             
             # Clean up text
             clean_text = self._clean_text(combined_text)
@@ -286,90 +589,175 @@ class ScreenReader:
             
         except Exception as e:
             logger.error(f"KerasOCR extraction failed: {e}")
+            # Force a full-frame OCR next time
+            self._tile_hashes = None
+            self._tile_words = {}
             return "", 0.0
     
-    def _estimate_text_confidence(self, text: str) -> float:
+    def _extract_words_keras(self, image: np.ndarray) -> Tuple[List[str], np.ndarray]:
+        """
+        Run KerasOCR on an RGB image.
+        
+        Returns:
+            Tuple of (non-empty words, word box centers as (x, y) in image coordinates)
+        """
+        # Run OCR: one detector pass, then every crop in a single batch
+        image_rgb, boxes = self._detect(image)
+        if len(boxes) == 0:
+            return [], np.empty((0, 2))
+        
+        predictions = self._recognize_batch(image_rgb, boxes)
+        
+        # Map box centers from detector scale back to the input image
+        centers = boxes.mean(axis=1) * (image.shape[1] / image_rgb.shape[1])
+        
+        keep = [i for i, text in enumerate(predictions) if text.strip()]
+        return [predictions[i].strip() for i in keep], centers[keep]
+    
+    def _calculate_tile_hashes(self, gray: np.ndarray) -> np.ndarray:
+        """
+        Calculate a 64-bit dHash for every tile of the frame in one pass.
+        
+        Returns:
+            uint8 array of shape (grid, grid, 8) holding each tile's packed hash
+        """
+        grid = self._tile_grid
+        
+        # One 9x8 thumbnail per tile, then left/right gradient bits per tile
+        small = cv2.resize(gray, (grid * 9, grid * 8), interpolation=cv2.INTER_AREA)
+        tiles = small.reshape(grid, 8, grid, 9).transpose(0, 2, 1, 3)
+        diff = tiles[..., 1:] > tiles[..., :-1]
+        return np.packbits(diff.reshape(grid, grid, 64), axis=-1)
+    
+    def _detect(self, image_rgb: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
         """
-        Estimate confidence for extracted text based on characteristics.
+        Run the KerasOCR detector on a single RGB image.
+        
+        Returns:
+            Tuple of (image at detector scale, word boxes of shape (N, 4, 2))
+        """
+        import keras_ocr  # Already loaded along with the pipeline
+        
+        pipeline = self.ocr_pipeline
+        
+        # Match Pipeline.recognize: upscale, but cap the longest side at max_size
+        image_rgb, _ = keras_ocr.tools.resize_image(
+            image_rgb, max_scale=pipeline.scale, max_size=pipeline.max_size
+        )
+        
+        return image_rgb, pipeline.detector.detect(images=[image_rgb])[0]
+    
+    def _recognize_batch(self, image_rgb: np.ndarray, boxes: np.ndarray) -> List[str]:
+        """
+        Recognize all detected word boxes in one recognizer call.
         
         Args:
-            text: Extracted text string
+            image_rgb: Image returned by _detect
+            boxes: Word boxes returned by _detect
             
         Returns:
-            Confidence score between 0.0 and 1.0
+            Recognized string per box
         """
-        if not text:
-            return 0.0
+        return self.ocr_pipeline.recognizer.recognize_from_boxes(
+            images=[image_rgb],
+            box_groups=[boxes],
+            batch_size=max(min(len(boxes), _RECOGNIZER_MAX_BATCH), 1)
+        )[0]
+    
+    def _estimate_confidence_batch(self, texts: List[str]) -> np.ndarray:
+        """
+        Estimate confidence for extracted texts based on characteristics.
         
-        # Base confidence
-        confidence = 0.5
+        All texts are scanned in one pass over their concatenated ASCII bytes,
+        which covers the KerasOCR alphabet.
         
-        # Longer text tends to be more reliable
-        if len(text) >= 3:
-            confidence += 0.2
-        if len(text) >= 10:
-            confidence += 0.1
+        Args:
+            texts: Extracted text strings
+            
+        Returns:
+            Array of confidence scores between 0.0 and 1.0, one per text
+        """
+        encoded = [text.encode("ascii", "replace") for text in texts]
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        chars = np.frombuffer(b"".join(encoded), dtype=np.uint8)
+        
+        # Classify every character at once
+        is_alpha = ((chars >= 65) & (chars <= 90)) | ((chars >= 97) & (chars <= 122))
+        is_digit = (chars >= 48) & (chars <= 57)
+        is_space = chars == 32
         
-        # Text with mixed alphanumeric characters is usually more reliable
-        has_letters = any(c.isalpha() for c in text)
-        has_numbers = any(c.isdigit() for c in text)
-        has_spaces = ' ' in text
+        # Per-text counts; bincount keeps empty texts at zero
+        owner = np.repeat(np.arange(len(texts)), lengths)
+        letters = np.bincount(owner, weights=is_alpha, minlength=len(texts))
+        digits = np.bincount(owner, weights=is_digit, minlength=len(texts))
+        spaces = np.bincount(owner, weights=is_space, minlength=len(texts))
+        special_chars = lengths - letters - digits - spaces
         
-        if has_letters:
-            confidence += 0.1
-        if has_numbers and has_letters:
-            confidence += 0.1
-        if has_spaces:
-            confidence += 0.05
+        has_letters = letters > 0
         
-        # Penalize text with too many special characters
-        special_chars = sum(1 for c in text if not c.isalnum() and c != ' ')
-        if special_chars > len(text) * 0.3:  # More than 30% special chars
-            confidence -= 0.2
+        # Base confidence, with longer text tending to be more reliable
+        confidence = 0.5 + 0.2 * (lengths >= 3) + 0.1 * (lengths >= 10)
         
-        # Ensure confidence is between 0.0 and 1.0
-        return max(0.0, min(1.0, confidence))
+        # Mixed alphanumeric text is usually more reliable, text with more
+        # than 30% special chars less so; one table lookup applies all of it
+        flags = (
+            has_letters
+            | (has_letters & (digits > 0)) << 1
+            | (spaces > 0) << 2
+            | (special_chars > lengths * 0.3) << 3
+        )
+        confidence += _CONFIDENCE_DELTA[flags]
+        
+        confidence[lengths == 0] = 0.0
+        return np.clip(confidence, 0.0, 1.0)
     
     def _clean_text(self, text: str) -> str:
         """Clean and normalize extracted text."""
         if not text:
             return ""
         
-        # Remove excessive whitespace
-        text = ' '.join(text.split())
-        
-        # Remove very short or nonsensical fragments
-        words = text.split()
-        filtered_words = []
-        
-        for word in words:
-            # Keep words that are:
-            # - At least 2 characters long
-            # - Or single characters that are alphanumeric
-            # - Or common single-character words (a, I, etc.)
-            if len(word) >= 2 or word.isalnum() or word.lower() in ['a', 'i']:
-                filtered_words.append(word)
-        
-        return ' '.join(filtered_words)
+        # Split on any whitespace run (normalizes spacing) and drop stray
+        # single symbols; single alphanumerics such as "a" and "I" are kept
+        return ' '.join([
+            word for word in text.split()
+            if len(word) >= 2 or word.isalnum()
+        ])
     
-    def _calculate_image_hash(self, image: Image.Image) -> str:
-        """Calculate a simple hash of the image for change detection."""
+    def _calculate_image_hash(self, image: np.ndarray) -> str:
+        """
+        Calculate a 64-bit difference hash (dHash) of the image.
+        
+        Unlike an exact hash, similar frames produce hashes a small Hamming
+        distance apart, so minor pixel noise does not count as a change.
+        """
         try:
-            # Resize to small size for hash calculation
-            small_img = image.resize((8, 8), Image.Resampling.LANCZOS)
+            gray = cv2.cvtColor(image, cv2.COLOR_BGRA2GRAY)
             
-            # Convert to grayscale and get pixel data
-            gray_img = small_img.convert('L')
-            pixels = list(gray_img.getdata())
-            
-            # Simple hash based on pixel values
-            hash_value = hash(tuple(pixels))
-            return str(abs(hash_value))
+            # 9x8 so each row yields 8 left/right gradient bits
+            small = cv2.resize(gray, (9, 8), interpolation=cv2.INTER_AREA)
+            diff = small[:, 1:] > small[:, :-1]
+            return np.packbits(diff).tobytes().hex()
             
         except Exception as e:
             logger.error(f"Failed to calculate image hash: {e}")
             return str(time.time())
     
+    @staticmethod
+    def _calculate_frame_digest(image: np.ndarray) -> str:
+        """Exact 64-bit fingerprint of the raw pixels, hashed without copying."""
+        image = np.ascontiguousarray(image)
+        if xxhash is not None:
+            return xxhash.xxh3_64_hexdigest(image)
+        return hashlib.blake2b(image, digest_size=8).hexdigest()
+    
+    @staticmethod
+    def _hash_distance(hash_a: Optional[str], hash_b: Optional[str]) -> int:
+        """Hamming distance between two image hashes (64 if not comparable)."""
+        try:
+            return bin(int(hash_a, 16) ^ int(hash_b, 16)).count("1")
+        except (TypeError, ValueError):
+            return 64
+    
     def _is_context_changed(self, new_context: ScreenContext) -> bool:
         """Check if the screen context has significantly changed."""
         if not self.last_context:
@@ -379,12 +767,16 @@ class ScreenReader:
         if abs(len(new_context.text_content) - len(self.last_context.text_content)) > 50:
             return True
         
-        # Check if image hash changed (simple change detection)
-        if new_context.image_hash != self.last_context.image_hash:
-            return True
+        # Identical pixels need no perceptual comparison; otherwise check
+        # whether the image moved beyond the perceptual hash threshold
+        if (new_context.frame_digest is None
+                or new_context.frame_digest != self.last_context.frame_digest):
+            distance = self._hash_distance(new_context.image_hash, self.last_context.image_hash)
+            if distance > self._hash_threshold:
+                return True
         
         # Check time elapsed
-        time_diff = new_context.timestamp - self.last_context.timestamp
+        time_diff = (new_context.timestamp - self.last_context.timestamp) / 1e9
         if time_diff > self.capture_interval * 2:
             return True
         
@@ -4,58 +4,187 @@ Implements a modern, glassmorphic design with animations and drag functionality.
 """
 import sys
 import asyncio
+import collections
+import concurrent.futures
+import functools
+import io
+import math
 import logging
 import threading
-from typing import Optional, List
-import json
 import time
+from typing import TYPE_CHECKING, Optional, List, Set, Deque, Tuple, Coroutine
 
 from PySide6.QtWidgets import (
     QApplication, QWidget, QVBoxLayout, QHBoxLayout, 
-    QTextEdit, QLineEdit, QPushButton, QLabel, QFrame,
-    QScrollArea, QSizePolicy, QGraphicsOpacityEffect
+    QLineEdit, QPushButton, QLabel, QFrame,
+    QScrollArea, QSizePolicy, QStyle, QStyleOption
 )
 from PySide6.QtCore import (
     Qt, QTimer, QPropertyAnimation, QEasingCurve, 
-    QPoint, QRect, QSize, Signal, QThread, QObject
-)
-from PySide6.QtGui import (
-    QPalette, QColor, QFont, QPainter, QPen, QBrush,
-    QLinearGradient, QPixmap, QIcon, QKeySequence
+    QPoint, QRectF, QSize, Signal
 )
+from PySide6.QtGui import QColor, QFont, QFontMetricsF, QPainter, QPixmap, QStaticText
 from PySide6.QtWidgets import QGraphicsDropShadowEffect
 
-from config.settings import UI_CONFIG, VOICE_CONFIG, HOTKEYS
-from src.ai_agent import get_ai_agent, ConversationMessage
-from src.voice_processor import get_voice_processor, VoiceResult
-from src.screen_reader import get_screen_reader, ScreenContext
+from config.settings import UI_CONFIG, VOICE_CONFIG
+
+if TYPE_CHECKING:
+    # The AI, voice and screen backends pull in langchain, audio and OpenCV;
+    # they are imported on the event loop thread once the window is up
+    from src.voice_processor import VoiceResult
+    from src.screen_reader import ScreenContext
 
 logger = logging.getLogger(__name__)
 
+# Stylesheets are built once at import so every widget shares the same string
+_BUTTON_STYLE = f"""
+    QPushButton {{
+        background-color: {UI_CONFIG['accent_color']};
+        color: {UI_CONFIG['text_color']};
+        border: none;
+        border-radius: 8px;
+        padding: 8px 16px;
+        font-weight: bold;
+        font-size: 12px;
+    }}
+    QPushButton:hover {{
+        background-color: #0099E5;
+    }}
+    QPushButton:pressed {{
+        background-color: #005A9E;
+    }}
+    QPushButton:disabled {{
+        background-color: #444444;
+        color: #888888;
+    }}
+"""
 
-class StreamingWorker(QObject):
-    """Worker for handling AI streaming responses in a separate thread."""
-    token_received = Signal(str)
-    response_complete = Signal()
-    error_occurred = Signal(str)
-    
-    def __init__(self):
-        super().__init__()
-        self.ai_agent = get_ai_agent()
+# Chat bubble frames: more opaque blue for user, almost fully opaque for AI
+_USER_BUBBLE_STYLE = """
+    QFrame {
+        background-color: rgba(0, 122, 204, 0.9);
+        border-radius: 15px;
+        2px solid rgba(0, 122, 204, 0.3);
+        margin-left: 50px;
+        margin: 6px;
+        padding: 8px;
+        min-height: 40px;
+    }
+"""
+
+_AI_BUBBLE_STYLE = """
+    QFrame {
+        background-color: rgba(70, 70, 70, 0.98);
+        border-radius: 15px;
+        2px solid rgba(255, 255, 255, 0.3);
+        margin-right: 50px;
+        margin: 6px;
+        padding: 8px;
+        min-height: 40px;
+    }
+"""
+
+# Chat bubble text: slight blue background for user, slight white for AI
+_USER_LABEL_STYLE = """
+    QLabel {
+        color: #FFFFFF;
+        background-color: rgba(0, 122, 204, 0.2);
+        line-height: 1.4;
+        border: 1px solid rgba(255, 255, 255, 0.2);
+        border-radius: 4px;
+        padding: 4px;
+        margin: 2px;
+    }
+"""
+
+_AI_LABEL_STYLE = """
+    QLabel {
+        color: #FFFFFF;
+        background-color: rgba(255, 255, 255, 0.1);
+        line-height: 1.4;
+        border: 1px solid rgba(255, 255, 255, 0.2);
+        border-radius: 4px;
+        padding: 4px;
+        margin: 2px;
+    }
+"""
+
+_CONTAINER_STYLE = f"""
+    QFrame {{
+        background-color: {UI_CONFIG['background_color']};
+        border-radius: {UI_CONFIG['border_radius']}px;
+        border: 1px solid rgba(255, 255, 255, 0.1);
+    }}
+"""
+
+_TITLE_STYLE = f"""
+    QLabel {{
+        color: {UI_CONFIG['text_color']};
+        font-size: 16px;
+        font-weight: bold;
+        background: transparent;
+    }}
+"""
+
+_CHAT_AREA_STYLE = """
+    QScrollArea {
+        background: transparent;
+        border: none;
+    }
+    QScrollBar:vertical {
+        background: rgba(255, 255, 255, 0.1);
+        width: 8px;
+        border-radius: 4px;
+    }
+    QScrollBar::handle:vertical {
+        background: rgba(255, 255, 255, 0.3);
+        border-radius: 4px;
+    }
+"""
+
+_CHAT_CONTENT_STYLE = """
+    QWidget {
+        background: transparent;
+        padding: 5px;
+    }
+"""
+
+_INPUT_STYLE = f"""
+    QLineEdit {{
+        background-color: rgba(255, 255, 255, 0.1);
+        color: {UI_CONFIG['text_color']};
+        border: 1px solid rgba(255, 255, 255, 0.2);
+        border-radius: 8px;
+        padding: 8px 12px;
+        font-size: 13px;
+    }}
+    QLineEdit:focus {{
+        border-color: {UI_CONFIG['accent_color']};
+    }}
+"""
+
+_VOICE_ACTIVE_STYLE = """
+    QPushButton {
+        background-color: #ff4444;
+        color: white;
+        border-radius: 20px;
+    }
+"""
+
+
+@functools.lru_cache(maxsize=1)
+def _bubble_font() -> Tuple[QFont, QFontMetricsF]:
+    """
+    Get the font shared by all chat bubble labels and its metrics.
     
-    async def process_message(self, message: str):
-        """Process message and emit streaming tokens."""
-        try:
-            response_parts = []
-            async for token in self.ai_agent.process_message(message):
-                response_parts.append(token)
-                self.token_received.emit(token)
-            
-            self.response_complete.emit()
-            
-        except Exception as e:
-            logger.error(f"Error in streaming worker: {e}")
-            self.error_occurred.emit(str(e))
+    Font rules in a stylesheet give every label its own resolved QFont; one
+    shared font set with setFont() is built and measured once. Created on
+    first use because font metrics need the QApplication to exist.
+    """
+    font = QFont()
+    font.setPixelSize(14)
+    font.setWeight(QFont.Weight.Medium)
+    return font, QFontMetricsF(font)
 
 
 class AnimatedButton(QPushButton):
@@ -63,36 +192,13 @@ class AnimatedButton(QPushButton):
     
     def __init__(self, text: str = "", parent=None):
         super().__init__(text, parent)
-        self.setStyleSheet(self._get_button_style())
+        self.setStyleSheet(_BUTTON_STYLE)
         
         # Animation setup
         self.animation = QPropertyAnimation(self, b"geometry")
         self.animation.setDuration(100)
         self.animation.setEasingCurve(QEasingCurve.Type.OutCubic)
     
-    def _get_button_style(self) -> str:
-        return f"""
-            QPushButton {{
-                background-color: {UI_CONFIG['accent_color']};
-                color: {UI_CONFIG['text_color']};
-                border: none;
-                border-radius: 8px;
-                padding: 8px 16px;
-                font-weight: bold;
-                font-size: 12px;
-            }}
-            QPushButton:hover {{
-                background-color: #0099E5;
-            }}
-            QPushButton:pressed {{
-                background-color: #005A9E;
-            }}
-            QPushButton:disabled {{
-                background-color: #444444;
-                color: #888888;
-            }}
-        """
-    
     def enterEvent(self, event):
         """Handle mouse enter for hover effect."""
         super().enterEvent(event)
@@ -103,105 +209,154 @@ class AnimatedButton(QPushButton):
         super().leaveEvent(event)
 
 
+class BubbleLabel(QLabel):
+    """
+    Plain-text label that paints its text from a cached QStaticText.
+    
+    The glyph layout is computed once per text/width change instead of on
+    every paint, and plain-text format skips QLabel's rich-text detection.
+    With caching enabled the finished label is rasterized once into a pixmap
+    that later paints (scrolling, window moves) simply blit.
+    """
+    
+    def __init__(self, text: str = "", parent=None):
+        super().__init__(text, parent)
+        self.setTextFormat(Qt.TextFormat.PlainText)
+        self._static = QStaticText(self._static_text(text))
+        self._static.setTextFormat(Qt.TextFormat.PlainText)
+        self._static_width = -1
+        self._cache_enabled = False
+        self._cache: Optional[QPixmap] = None
+    
+    def setText(self, text: str):
+        super().setText(text)
+        self._static.setText(self._static_text(text))
+        self._cache = None
+    
+    @staticmethod
+    def _static_text(text: str) -> str:
+        """Map newlines to line separators; plain-text QStaticText ignores "\\n"."""
+        return text.replace("\n", "\u2028")
+    
+    def set_cache_enabled(self, enabled: bool):
+        """Enable or disable painting from a cached pixmap."""
+        self._cache_enabled = enabled
+        self._cache = None
+    
+    def resizeEvent(self, event):
+        self._cache = None
+        super().resizeEvent(event)
+    
+    def paintEvent(self, event):
+        if not self._cache_enabled:
+            self._paint_label(QPainter(self))
+            return
+        
+        if self._cache is None:
+            ratio = self.devicePixelRatioF()
+            self._cache = QPixmap(self.size() * ratio)
+            self._cache.setDevicePixelRatio(ratio)
+            self._cache.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(self._cache)
+            self._paint_label(painter)
+            painter.end()
+        
+        QPainter(self).drawPixmap(0, 0, self._cache)
+    
+    def _paint_label(self, painter: QPainter):
+        """Paint the styled background and text onto the given painter."""
+        # Stylesheet background and border
+        option = QStyleOption()
+        option.initFrom(self)
+        self.style().drawPrimitive(QStyle.PrimitiveElement.PE_Widget, option, painter, self)
+        
+        rect = self.contentsRect()
+        if rect.width() != self._static_width:
+            self._static.setTextWidth(rect.width())
+            self._static_width = rect.width()
+        
+        painter.setFont(self.font())
+        painter.setPen(self.palette().color(self.foregroundRole()))
+        painter.drawStaticText(rect.topLeft(), self._static)
+
+
 class ChatBubble(QFrame):
     """Custom chat bubble widget with glassmorphic design."""
     
-    def __init__(self, text: str, is_user: bool = True, parent=None):
+    def __init__(self, text: str, is_user: bool = True, max_width: Optional[int] = None, parent=None):
         super().__init__(parent)
         self.is_user = is_user
         self.text = text
+        self._parked = False
         
         self.setFrameStyle(QFrame.Shape.NoFrame)
-        self.setStyleSheet(self._get_bubble_style())
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.setStyleSheet(_USER_BUBBLE_STYLE if is_user else _AI_BUBBLE_STYLE)
         
         # Layout
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 8, 12, 8)
         
         # Text label
-        self.text_label = QLabel(text)
+        self.text_label = BubbleLabel(text)
         self.text_label.setWordWrap(True)
-        
-        # Set different text color for user vs AI
-        if self.is_user:
-            text_color = "#FFFFFF"
-            bg_color = "rgba(0, 122, 204, 0.2)"  # Slight background for visibility
-        else:
-            text_color = "#FFFFFF"  
-            bg_color = "rgba(255, 255, 255, 0.1)"  # Slight white background for AI text
-        
-        self.text_label.setStyleSheet(f"""
-            QLabel {{
-                color: {text_color};
-                background-color: {bg_color};
-                font-size: 14px;
-                font-weight: 500;
-                line-height: 1.4;
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 4px;
-                padding: 4px;
-                margin: 2px;
-            }}
-        """)
+        self.text_label.setStyleSheet(_USER_LABEL_STYLE if is_user else _AI_LABEL_STYLE)
+        self.text_label.setFont(_bubble_font()[0])
+        self.text_label.set_cache_enabled(True)
+        
+        # A known width leaves only the height to recompute on each setText,
+        # and that is measured here rather than by a layout height-for-width pass
+        self._text_width = 0.0
+        if max_width:
+            self.text_label.setFixedWidth(max_width)
+            self.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.Minimum)
+            self.text_label.ensurePolished()
+            margins = self.text_label.contentsMargins()
+            self._text_width = max_width - margins.left() - margins.right()
+            self._fit_label_height(text)
         
         layout.addWidget(self.text_label)
-        
-        # Add shadow effect
-        shadow = QGraphicsDropShadowEffect()
-        shadow.setBlurRadius(10)
-        shadow.setColor(QColor(0, 0, 0, 60))
-        shadow.setOffset(0, 2)
-        self.setGraphicsEffect(shadow)
     
-    def _get_bubble_style(self) -> str:
-        if self.is_user:
-            bg_color = "rgba(0, 122, 204, 0.9)"  # More opaque blue for user
-            alignment = "margin-left: 50px;"
-            border = "2px solid rgba(0, 122, 204, 0.3);"
-        else:
-            bg_color = "rgba(70, 70, 70, 0.98)"  # Almost fully opaque for AI responses
-            alignment = "margin-right: 50px;"
-            border = "2px solid rgba(255, 255, 255, 0.3);"  # More visible border
-        
-        return f"""
-            QFrame {{
-                background-color: {bg_color};
-                border-radius: 15px;
-                {border}
-                {alignment}
-                margin: 6px;
-                padding: 8px;
-                min-height: 40px;
-            }}
+    def _fit_label_height(self, text: str):
+        """Fix the label height to the wrapped height of text at the bubble width."""
+        metrics = _bubble_font()[1]
+        bounds = metrics.boundingRect(
+            QRectF(0, 0, self._text_width, 1e6), Qt.TextFlag.TextWordWrap, text
+        )
+        margins = self.text_label.contentsMargins()
+        height = max(bounds.height(), metrics.height())
+        self.text_label.setFixedHeight(math.ceil(height) + margins.top() + margins.bottom())
+    
+    def set_parked(self, parked: bool):
         """
+        Park or restore a bubble scrolled far outside the viewport.
+        
+        A parked bubble keeps its current height as a fixed size and hides its
+        label, so the chat layout no longer re-solves its word-wrapped text.
+        """
+        if parked == self._parked:
+            return
+        self._parked = parked
+        
+        if parked:
+            self.setFixedHeight(self.height())
+            self.text_label.hide()
+        else:
+            self.text_label.show()
+            self.setMinimumHeight(0)
+            self.setMaximumHeight(16777215)  # QWIDGETSIZE_MAX
+    
+    def set_streaming(self, streaming: bool):
+        """Paint live while a response streams in, from cache once it settles."""
+        self.text_label.set_cache_enabled(not streaming)
     
     def update_text(self, new_text: str):
         """Update the bubble text (for streaming)."""
-        logger.info(f"[DEBUG] ChatBubble.update_text called with: '{new_text[:100]}...'")
-        logger.info(f"[DEBUG] Bubble is_user: {self.is_user}, visible: {self.isVisible()}")
-        logger.info(f"[DEBUG] Text label visible: {self.text_label.isVisible()}")
-        logger.info(f"[DEBUG] Old text: '{self.text[:50]}...'")
-        
+        # setText schedules the repaint; Qt coalesces it with the next frame
         self.text = new_text
         self.text_label.setText(new_text)
-        
-        # Debug the actual text that was set
-        actual_text = self.text_label.text()
-        logger.info(f"[DEBUG] Text actually set to label: '{actual_text[:100]}...'")
-        logger.info(f"[DEBUG] Label geometry: {self.text_label.geometry()}")
-        logger.info(f"[DEBUG] Bubble geometry: {self.geometry()}")
-        logger.info(f"[DEBUG] Label font: {self.text_label.font()}")
-        logger.info(f"[DEBUG] Label style sheet: {self.text_label.styleSheet()}")
-        
-        # Force refresh and check if text is empty
-        if not new_text.strip():
-            logger.warning("[DEBUG] WARNING: New text is empty or whitespace only!")
-        
-        self.text_label.update()
-        self.update()
-        self.repaint()
-        
-        logger.info(f"[DEBUG] ChatBubble text updated successfully")
+        if self._text_width:
+            self._fit_label_height(new_text)
 
 
 class FloatingAssistant(QWidget):
@@ -209,7 +364,13 @@ class FloatingAssistant(QWidget):
     
     # Define signals for thread-safe communication
     screen_context_received = Signal(object)  # ScreenContext
-    response_update_signal = Signal(str)  # For updating response bubbles
+    response_token_signal = Signal(str)  # Streamed token for the response bubble
+    response_complete_signal = Signal(str)  # Final response text
+    response_error_signal = Signal()
+    backends_ready_signal = Signal()
+    suggestion_signal = Signal(str)  # Proactive suggestion to show in chat
+    startup_context_signal = Signal(object)  # Startup ScreenContext, or None
+    voice_input_signal = Signal(object)  # VoiceResult from the mic button, or None on error
     
     def __init__(self):
         super().__init__()
@@ -218,32 +379,64 @@ class FloatingAssistant(QWidget):
         self.is_expanded = False
         self.is_dragging = False
         self.drag_position = QPoint()
-        self.chat_bubbles: List[ChatBubble] = []
+        # Only the newest bubbles stay live as widgets; the text log outlives them
+        self.chat_bubbles: Deque[ChatBubble] = collections.deque(
+            maxlen=UI_CONFIG.get("max_live_bubbles", 200)
+        )
+        self.chat_log: Deque[Tuple[str, bool, float]] = collections.deque(maxlen=10000)
         self.current_response_bubble: Optional[ChatBubble] = None
         self.is_voice_active = False
         
-        # Components
-        self.ai_agent = get_ai_agent()
-        self.voice_processor = get_voice_processor()
-        self.screen_reader = get_screen_reader()
+        # Streamed tokens are buffered and flushed to the bubble every 32 ms
+        self._stream_buf: List[str] = []
+        self._stream_timer = QTimer(self)
+        self._stream_timer.setInterval(32)
+        self._stream_timer.setSingleShot(True)
+        self._stream_timer.timeout.connect(self._flush_stream)
+        
+        # Screen-context suggestions wait for 2 s of quiet, one at a time
+        self._suggest_timer = QTimer(self)
+        self._suggest_timer.setInterval(2000)
+        self._suggest_timer.setSingleShot(True)
+        self._suggest_timer.timeout.connect(self._request_suggestion)
+        self._suggest_inflight = False
+        self._last_ctx_hash = 0
+        
+        # Components, created off the GUI thread by _init_backends
+        self.ai_agent = None
+        self.voice_processor = None
+        self.screen_reader = None
+        self._ai_agent_error: Optional[str] = None
+        
+        # One persistent event loop thread runs every AI/TTS coroutine
+        self._loop = asyncio.new_event_loop()
+        self._loop_thread = threading.Thread(
+            target=self._loop.run_forever, name="sage-asyncio", daemon=True
+        )
+        self._loop_thread.start()
         
-        # Streaming worker
-        self.streaming_worker = StreamingWorker()
-        self.streaming_worker.token_received.connect(self._on_token_received)
-        self.streaming_worker.response_complete.connect(self._on_response_complete)
-        self.streaming_worker.error_occurred.connect(self._on_error_occurred)
+        # Futures still running on the loop, kept so they can be cancelled on close
+        self._bg_tasks: Set[concurrent.futures.Future] = set()
+        
+        # Utterances are spoken one after another on the loop, never overlapping;
+        # the lock is created on the loop by _init_backends
+        self._tts_lock: Optional[asyncio.Lock] = None
         
         # Screen context signal
         self.screen_context_received.connect(self._handle_screen_context_safe)
         
-        # Response update signal
-        self.response_update_signal.connect(self._update_response_bubble)
+        # Response signals, emitted from the event loop thread
+        self.response_token_signal.connect(self._on_response_token)
+        self.response_complete_signal.connect(self._mark_response_complete)
+        self.response_error_signal.connect(self._handle_message_error)
+        self.suggestion_signal.connect(self._show_suggestion)
+        self.backends_ready_signal.connect(self._on_backends_ready)
+        self.startup_context_signal.connect(self._on_startup_context)
+        self.voice_input_signal.connect(self._on_voice_input)
         
         # Setup UI
         self._setup_ui()
         self._setup_signals()
-        self._setup_voice()
-        self._setup_screen_monitoring()
         
         # Setup hotkeys
         self._setup_hotkeys()
@@ -253,8 +446,66 @@ class FloatingAssistant(QWidget):
         
         logger.info("Floating assistant UI initialized")
         
+        # Load the backends while the window shows; input waits until they're ready
+        self.voice_btn.setEnabled(False)
+        self.send_btn.setEnabled(False)
+        self._run_async(self._init_backends())
+    
+    async def _init_backends(self):
+        """
+        Import and create the AI, voice and screen backends.
+        
+        Each backend is created on its own, so one failing (no microphone,
+        a bad API key) leaves the others usable. Ready is always emitted.
+        """
+        # Created here so it binds to this loop, not the GUI thread's (Python < 3.10)
+        self._tts_lock = asyncio.Lock()
+        
+        try:
+            from src.ai_agent import get_ai_agent
+            self.ai_agent = get_ai_agent()
+        except Exception as e:
+            logger.error(f"Failed to initialize AI agent: {e}")
+            self._ai_agent_error = str(e)
+        
+        try:
+            from src.voice_processor import get_voice_processor
+            self.voice_processor = get_voice_processor()
+        except Exception as e:
+            logger.error(f"Failed to initialize voice processor: {e}")
+        
+        try:
+            from src.screen_reader import get_screen_reader
+            self.screen_reader = get_screen_reader()
+        except Exception as e:
+            logger.error(f"Failed to initialize screen reader: {e}")
+        
+        self.backends_ready_signal.emit()
+    
+    def _on_backends_ready(self):
+        """Wire up the backends and enable input for the ones that loaded."""
+        if self.ai_agent is None:
+            if not self.is_expanded:
+                self.toggle_expand()
+            self._add_chat_bubble(
+                f"Sorry, the AI assistant failed to start: {self._ai_agent_error}", is_user=False
+            )
+        else:
+            self.send_btn.setEnabled(True)
+        
+        if self.voice_processor is not None:
+            self.voice_btn.setEnabled(True)
+            self._setup_voice()
+        
+        # Screen context only feeds the AI agent, so it needs both
+        if self.screen_reader is not None and self.ai_agent is not None:
+            self._setup_screen_monitoring()
+        
+        logger.info("Assistant backends initialized")
+        
         # Auto-generate screen context and speak on startup
-        QTimer.singleShot(3000, self._startup_screen_analysis)
+        if self.screen_reader is not None and self.ai_agent is not None:
+            QTimer.singleShot(3000, self._startup_screen_analysis)
     
     def _setup_ui(self):
         """Setup the user interface."""
@@ -276,9 +527,17 @@ class FloatingAssistant(QWidget):
         
         # Create main container with glassmorphic background
         self.container = QFrame()
-        self.container.setStyleSheet(self._get_container_style())
+        self.container.setStyleSheet(_CONTAINER_STYLE)
         self.main_layout.addWidget(self.container)
         
+        # One shadow for the whole window; per-bubble shadows each cost an
+        # offscreen buffer and a blur pass on every repaint
+        shadow = QGraphicsDropShadowEffect()
+        shadow.setBlurRadius(10)
+        shadow.setColor(QColor(0, 0, 0, 60))
+        shadow.setOffset(0, 2)
+        self.container.setGraphicsEffect(shadow)
+        
         # Container layout
         self.container_layout = QVBoxLayout(self.container)
         self.container_layout.setContentsMargins(15, 15, 15, 15)
@@ -295,16 +554,12 @@ class FloatingAssistant(QWidget):
         
         # Initially hide chat area
         self.chat_area.hide()
-    
-    def _get_container_style(self) -> str:
-        """Get the glassmorphic container style."""
-        return f"""
-            QFrame {{
-                background-color: {UI_CONFIG['background_color']};
-                border-radius: {UI_CONFIG['border_radius']}px;
-                border: 1px solid rgba(255, 255, 255, 0.1);
-            }}
-        """
+        
+        # Expand/collapse animation, reused for every toggle
+        self.expand_animation = QPropertyAnimation(self, b"size")
+        self.expand_animation.setDuration(UI_CONFIG["animation_duration"])
+        self.expand_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        self.expand_animation.finished.connect(self._on_expand_finished)
     
     def _create_header(self):
         """Create the header with title and controls."""
@@ -312,14 +567,7 @@ class FloatingAssistant(QWidget):
         
         # Title
         self.title_label = QLabel("SAGE")
-        self.title_label.setStyleSheet(f"""
-            QLabel {{
-                color: {UI_CONFIG['text_color']};
-                font-size: 16px;
-                font-weight: bold;
-                background: transparent;
-            }}
-        """)
+        self.title_label.setStyleSheet(_TITLE_STYLE)
         header_layout.addWidget(self.title_label)
         
         header_layout.addStretch()
@@ -347,37 +595,25 @@ class FloatingAssistant(QWidget):
         self.chat_area.setWidgetResizable(True)
         self.chat_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
         self.chat_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-        self.chat_area.setStyleSheet("""
-            QScrollArea {
-                background: transparent;
-                border: none;
-            }
-            QScrollBar:vertical {
-                background: rgba(255, 255, 255, 0.1);
-                width: 8px;
-                border-radius: 4px;
-            }
-            QScrollBar::handle:vertical {
-                background: rgba(255, 255, 255, 0.3);
-                border-radius: 4px;
-            }
-        """)
+        self.chat_area.setStyleSheet(_CHAT_AREA_STYLE)
         
         # Chat content widget
         self.chat_content = QWidget()
-        self.chat_content.setStyleSheet("""
-            QWidget {
-                background: transparent;
-                padding: 5px;
-            }
-        """)
+        self.chat_content.setStyleSheet(_CHAT_CONTENT_STYLE)
         self.chat_layout = QVBoxLayout(self.chat_content)
         self.chat_layout.setContentsMargins(10, 10, 10, 10)
         self.chat_layout.setSpacing(8)
         self.chat_layout.addStretch()  # Push messages to bottom
         
+        # Bubble text width: window, container, scroll area frame and scrollbar,
+        # chat layout, bubble margin and bubble layout, both sides each
+        self._bubble_width = UI_CONFIG["window_width"] - 2 * 10 - 2 * 15 - 2 - 8 - 2 * 10 - 2 * 6 - 2 * 12
+        
         self.chat_area.setWidget(self.chat_content)
         self.container_layout.addWidget(self.chat_area)
+        
+        # Only bubbles near the viewport keep their text live in the layout
+        self.chat_area.verticalScrollBar().valueChanged.connect(self._update_bubble_visibility)
     
     def _create_input_area(self):
         """Create the input area with text field and buttons."""
@@ -386,19 +622,7 @@ class FloatingAssistant(QWidget):
         # Text input
         self.text_input = QLineEdit()
         self.text_input.setPlaceholderText("Type your message...")
-        self.text_input.setStyleSheet(f"""
-            QLineEdit {{
-                background-color: rgba(255, 255, 255, 0.1);
-                color: {UI_CONFIG['text_color']};
-                border: 1px solid rgba(255, 255, 255, 0.2);
-                border-radius: 8px;
-                padding: 8px 12px;
-                font-size: 13px;
-            }}
-            QLineEdit:focus {{
-                border-color: {UI_CONFIG['accent_color']};
-            }}
-        """)
+        self.text_input.setStyleSheet(_INPUT_STYLE)
         self.text_input.returnPressed.connect(self._send_message)
         input_layout.addWidget(self.text_input)
         
@@ -453,19 +677,13 @@ class FloatingAssistant(QWidget):
         """Toggle between expanded and collapsed states."""
         target_height = UI_CONFIG["expanded_height"] if not self.is_expanded else UI_CONFIG["window_height"]
         
-        # Create animation
-        self.expand_animation = QPropertyAnimation(self, b"size")
-        self.expand_animation.setDuration(UI_CONFIG["animation_duration"])
-        self.expand_animation.setEasingCurve(QEasingCurve.Type.OutCubic)
+        # Restart from the current size so a toggle mid-animation reverses smoothly
+        self.expand_animation.stop()
         self.expand_animation.setStartValue(self.size())
         self.expand_animation.setEndValue(QSize(UI_CONFIG["window_width"], target_height))
         
-        # Handle animation completion
-        if not self.is_expanded:
-            self.expand_animation.finished.connect(lambda: self.chat_area.show())
-            self.chat_area.hide()  # Hide during collapse
-        else:
-            self.chat_area.hide()
+        # Chat area stays hidden while resizing; shown again once expanded
+        self.chat_area.hide()
         
         self.expand_animation.start()
         self.is_expanded = not self.is_expanded
@@ -473,10 +691,15 @@ class FloatingAssistant(QWidget):
         # Update button icon
         self.expand_btn.setText("📋" if not self.is_expanded else "➖")
     
+    def _on_expand_finished(self):
+        """Show the chat area once the window has finished expanding."""
+        if self.is_expanded:
+            self.chat_area.show()
+    
     def _send_message(self):
         """Send user message to AI."""
         message = self.text_input.text().strip()
-        if not message:
+        if not message or self.ai_agent is None:
             return
         
         logger.info(f"[DEBUG] _send_message called with: '{message}'")
@@ -494,142 +717,102 @@ class FloatingAssistant(QWidget):
         # Create placeholder for AI response
         logger.info("[DEBUG] Creating AI response bubble placeholder")
         self.current_response_bubble = self._add_chat_bubble("", is_user=False)
+        self.current_response_bubble.set_streaming(True)
         logger.info(f"[DEBUG] Created AI response bubble: {self.current_response_bubble}")
         logger.info(f"[DEBUG] AI bubble visible: {self.current_response_bubble.isVisible()}")
         logger.info(f"[DEBUG] AI bubble text label: {self.current_response_bubble.text_label}")
         logger.info(f"[DEBUG] AI bubble initial text: '{self.current_response_bubble.text_label.text()}'")
         
-        # Process message asynchronously using QTimer
+        # Hand the message to the event loop thread
         logger.info("[DEBUG] Scheduling async task for AI processing")
-        QTimer.singleShot(0, lambda: self._schedule_async_task(message))
+        self._schedule_async_task(message)
+    
+    def _run_async(self, coro: Coroutine) -> concurrent.futures.Future:
+        """Schedule a coroutine on the shared event loop thread."""
+        future = asyncio.run_coroutine_threadsafe(coro, self._loop)
+        self._bg_tasks.add(future)
+        future.add_done_callback(self._bg_tasks.discard)
+        future.add_done_callback(self._log_async_error)
+        return future
+    
+    @staticmethod
+    def _log_async_error(future: concurrent.futures.Future):
+        """Log an exception that escaped a scheduled coroutine."""
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Error in async task: {future.exception()}")
     
     def _schedule_async_task(self, message: str):
         """Schedule async task safely."""
         try:
-            # Use asyncio.run for better compatibility
-            import asyncio
-            import threading
-            
-            def run_async():
-                try:
-                    asyncio.run(self._process_message_async(message))
-                except Exception as e:
-                    logger.error(f"Error in async task: {e}")
-                    # Update UI on error
-                    QTimer.singleShot(0, lambda: self._handle_async_error())
-            
-            # Run in separate thread to avoid blocking UI
-            thread = threading.Thread(target=run_async, daemon=True)
-            thread.start()
+            self._run_async(self._process_message_async(message))
             
         except Exception as e:
             logger.error(f"Error scheduling async task: {e}")
             if self.current_response_bubble:
                 self.current_response_bubble.update_text("Sorry, I encountered an error processing your request.")
     
-    def _handle_async_error(self):
-        """Handle error from async task."""
-        if self.current_response_bubble:
-            self.current_response_bubble.update_text("Sorry, I encountered an error processing your request.")
-    
     async def _process_message_async(self, message: str):
         """Process message asynchronously."""
         try:
             logger.info(f"[DEBUG] Starting async LLM processing for message: {message}")
-            response_parts = []
+            response_buffer = io.StringIO()
             token_count = 0
-            full_response = ""  # Initialize here to avoid UnboundLocalError
             
             async for token in self.ai_agent.process_message(message):
-                logger.info(f"[DEBUG] Received token from LLM: '{token}' (type: {type(token)})")
-                response_parts.append(str(token))  # Ensure it's a string
+                token = str(token)  # Ensure it's a string
+                response_buffer.write(token)
                 token_count += 1
-                full_response = ''.join(response_parts)
-                logger.info(f"[DEBUG] Streaming response so far ({token_count} tokens): '{full_response[:100]}...'")
-                self._update_response_bubble_direct(full_response)
+                # Guarded, this runs per token
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Received token %d from LLM: '%s'", token_count, token)
+                self.response_token_signal.emit(token)
             
+            full_response = response_buffer.getvalue()
             logger.info(f"[DEBUG] LLM response streaming complete. Total tokens: {token_count}")
             logger.info(f"[DEBUG] Final full response: '{full_response[:200]}...'")
-            QTimer.singleShot(0, lambda: self._mark_response_complete(full_response))
+            self.response_complete_signal.emit(full_response)
         except Exception as e:
             logger.error(f"[DEBUG] Error processing LLM message: {e}")
-            QTimer.singleShot(0, lambda: self._handle_message_error())
-
-    def _update_response_bubble_direct(self, response: str):
-        """Update response bubble directly (called from async thread)."""
-        logger.info(f"[DEBUG] _update_response_bubble_direct called with response: '{response[:100]}...'")
-        if self.current_response_bubble:
-            logger.info("[DEBUG] Emitting response_update_signal")
-            self.response_update_signal.emit(response)
-            
-            # Also try direct method call as fallback
-            logger.info("[DEBUG] Also trying direct method call as fallback")
-            try:
-                self.current_response_bubble.update_text(response)
-                logger.info("[DEBUG] Direct method call succeeded")
-            except Exception as e:
-                logger.error(f"[DEBUG] Direct method call failed: {e}")
-        else:
-            logger.warning("[DEBUG] No current response bubble to update!")
-    
-    def _execute_pending_update(self):
-        """Execute the pending UI update in the main thread."""
-        if hasattr(self, '_pending_response'):
-            response = self._pending_response
-            delattr(self, '_pending_response')
-            logger.info(f"[DEBUG] _execute_pending_update called with: '{response[:100]}...'")
-            self._update_response_bubble(response)
-        else:
-            logger.warning("[DEBUG] No pending response to update!")
+            self.response_error_signal.emit()
 
-    def _update_response_bubble(self, response: str):
-        """Update response bubble in UI thread."""
-        logger.info(f"[DEBUG] _update_response_bubble called with: '{response[:100]}...'")
-        logger.info(f"[DEBUG] Current thread: {threading.current_thread().name}")
-        logger.info(f"[DEBUG] self.current_response_bubble exists: {self.current_response_bubble is not None}")
+    def _on_response_token(self, token: str):
+        """Buffer a streamed token; the bubble is refreshed when the timer fires."""
+        self._stream_buf.append(token)
+        if not self._stream_timer.isActive():
+            self._stream_timer.start()
+    
+    def _flush_stream(self):
+        """Append all buffered tokens to the response bubble in one update."""
+        if not self._stream_buf:
+            return
+        
+        chunk = ''.join(self._stream_buf)
+        self._stream_buf.clear()
         
         if self.current_response_bubble:
-            logger.info("[DEBUG] Updating current response bubble text.")
-            logger.info(f"[DEBUG] Bubble before update - text: '{self.current_response_bubble.text_label.text()}'")
-            self.current_response_bubble.update_text(response)
-            logger.info(f"[DEBUG] Bubble after update - text: '{self.current_response_bubble.text_label.text()}'")
+            self.current_response_bubble.update_text(self.current_response_bubble.text + chunk)
             self._scroll_to_bottom()
-            self.current_response_bubble.repaint()
-            self.chat_area.repaint()
-            logger.info("[DEBUG] Response bubble updated successfully.")
-        else:
-            logger.warning("[DEBUG] No current response bubble to update!")
 
-    def _mark_response_complete(self, full_response: str = ""):
+    def _mark_response_complete(self, final_text: str):
         """Mark response as complete in UI thread."""
         logger.info("[DEBUG] Marking response as complete...")
-        response_to_speak = full_response
-        if not response_to_speak and self.current_response_bubble:
-            response_to_speak = self.current_response_bubble.text_label.text()
-        logger.info(f"[DEBUG] Final response to speak: '{response_to_speak[:200]}...'")
-        if VOICE_CONFIG.get("ai_speak_responses", True) and response_to_speak.strip():
+        self._stream_timer.stop()
+        self._flush_stream()
+        logger.info(f"[DEBUG] Final response to speak: '{final_text[:200]}...'")
+        if final_text:
+            self.chat_log.append((final_text, False, time.time()))
+        if VOICE_CONFIG.get("ai_speak_responses", True) and final_text.strip():
             logger.info("[DEBUG] Starting AI speech for response.")
-            self._speak_response_simple(response_to_speak)
+            self._speak_response_simple(final_text)
+        if self.current_response_bubble:
+            self.current_response_bubble.set_streaming(False)
         self.current_response_bubble = None
     
     def _speak_response(self, response_text: str):
         """Speak the AI response."""
         try:
             logger.info(f"Starting to speak response: {response_text[:50]}...")
-            # Use threading to avoid blocking UI
-            import threading
-            def speak_async():
-                try:
-                    import asyncio
-                    logger.info("Running TTS in thread...")
-                    asyncio.run(self.voice_processor.speak_text(response_text))
-                    logger.info("TTS completed successfully")
-                except Exception as e:
-                    logger.error(f"Error speaking response: {e}")
-            
-            thread = threading.Thread(target=speak_async, daemon=True)
-            thread.start()
-            logger.info("TTS thread started")
+            self._run_async(self._speak(response_text))
             
         except Exception as e:
             logger.error(f"Error scheduling speech: {e}")
@@ -638,33 +821,32 @@ class FloatingAssistant(QWidget):
         """Speak response using faster local TTS."""
         try:
             logger.info(f"Speaking with local TTS: {text[:50]}...")
-            # Use threading to avoid blocking UI
-            import threading
-            def speak_async():
-                try:
-                    import asyncio
-                    # Use local TTS which is faster
-                    asyncio.run(self.voice_processor.speak_text(text, use_gtts=False))
-                    logger.info("Local TTS completed successfully")
-                except Exception as e:
-                    logger.error(f"Error with local TTS: {e}")
-            
-            thread = threading.Thread(target=speak_async, daemon=True)
-            thread.start()
+            # Use local TTS which is faster
+            self._run_async(self._speak(text, use_gtts=False))
             
         except Exception as e:
             logger.error(f"Error with simple speech: {e}")
     
+    async def _speak(self, text: str, use_gtts: bool = True):
+        """Speak text once any utterance already playing has finished."""
+        if self.voice_processor is None:
+            return
+        async with self._tts_lock:
+            await self.voice_processor.speak_text(text, use_gtts=use_gtts)
+    
     def _handle_message_error(self):
         """Handle message processing error in UI thread."""
+        self._stream_timer.stop()
+        self._stream_buf.clear()
         if self.current_response_bubble:
             self.current_response_bubble.update_text("Sorry, I encountered an error processing your request.")
+            self.current_response_bubble.set_streaming(False)
         self.current_response_bubble = None
     
     def _add_chat_bubble(self, text: str, is_user: bool = True) -> ChatBubble:
         """Add a chat bubble to the conversation."""
         logger.info(f"[DEBUG] Creating {'user' if is_user else 'AI'} bubble with text: '{text[:100]}...'")
-        bubble = ChatBubble(text, is_user)
+        bubble = ChatBubble(text, is_user, max_width=self._bubble_width)
         
         # Debug logging
         logger.info(f"[DEBUG] Bubble created with geometry: {bubble.geometry()}")
@@ -672,10 +854,18 @@ class FloatingAssistant(QWidget):
         logger.info(f"[DEBUG] Bubble text label text: '{bubble.text_label.text()[:100]}...'")
         logger.info(f"[DEBUG] Chat layout count before insert: {self.chat_layout.count()}")
         
+        # Drop the oldest widget once the live window is full
+        if len(self.chat_bubbles) == self.chat_bubbles.maxlen:
+            evicted = self.chat_bubbles.popleft()
+            self.chat_layout.removeWidget(evicted)
+            evicted.deleteLater()
+        
         # Insert before the stretch item (which is last)
         insert_index = self.chat_layout.count() - 1
         self.chat_layout.insertWidget(insert_index, bubble)
         self.chat_bubbles.append(bubble)
+        if text:
+            self.chat_log.append((text, is_user, time.time()))
         
         logger.info(f"[DEBUG] Chat layout count after insert: {self.chat_layout.count()}")
         
@@ -697,6 +887,18 @@ class FloatingAssistant(QWidget):
         
         return bubble
     
+    def _update_bubble_visibility(self):
+        """Park bubbles more than one viewport away from the visible area."""
+        viewport_height = self.chat_area.viewport().height()
+        top = self.chat_area.verticalScrollBar().value() - viewport_height
+        bottom = top + 3 * viewport_height
+        
+        for bubble in self.chat_bubbles:
+            if bubble is self.current_response_bubble:
+                continue
+            geometry = bubble.geometry()
+            bubble.set_parked(geometry.bottom() < top or geometry.top() > bottom)
+    
     def _scroll_to_bottom(self):
         """Scroll chat area to bottom."""
         scrollbar = self.chat_area.verticalScrollBar()
@@ -717,16 +919,10 @@ class FloatingAssistant(QWidget):
         """Start voice input."""
         self.is_voice_active = True
         self.voice_btn.setText("🔴")
-        self.voice_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #ff4444;
-                color: white;
-                border-radius: 20px;
-            }
-        """)
+        self.voice_btn.setStyleSheet(_VOICE_ACTIVE_STYLE)
         
         # Start listening
-        asyncio.create_task(self._listen_for_voice())
+        self._run_async(self._listen_for_voice())
     
     def _stop_voice_input(self):
         """Stop voice input."""
@@ -735,42 +931,58 @@ class FloatingAssistant(QWidget):
         self.voice_btn.setStyleSheet("")  # Reset to default
     
     async def _listen_for_voice(self):
-        """Listen for voice input."""
+        """Listen for voice input off the GUI thread and post the result back."""
+        # listen_once blocks on the microphone for up to its timeout
+        loop = asyncio.get_running_loop()
         try:
-            result = self.voice_processor.listen_once(timeout=10.0)
-            if result.success and result.text:
+            result = await loop.run_in_executor(None, self.voice_processor.listen_once, 10.0)
+        except Exception as e:
+            logger.error(f"Voice input error: {e}")
+            result = None
+        
+        self.voice_input_signal.emit(result)
+    
+    def _on_voice_input(self, result: Optional["VoiceResult"]):
+        """Handle the result of a mic-button listen in the GUI thread."""
+        try:
+            if result is None:
+                self._show_status("Voice input failed")
+            elif result.success and result.text:
                 self.text_input.setText(result.text)
                 self._send_message()
             else:
                 self._show_status("Could not understand voice input")
-        except Exception as e:
-            logger.error(f"Voice input error: {e}")
-            self._show_status("Voice input failed")
         finally:
             self._stop_voice_input()
     
-    def _on_voice_result(self, result: VoiceResult):
+    def _on_voice_result(self, result: "VoiceResult"):
         """Handle voice recognition result."""
         if result.success and result.text:
             self.text_input.setText(result.text)
             if self.is_voice_active:
                 self._send_message()
     
-    def _on_screen_context(self, context: ScreenContext):
+    def _on_screen_context(self, context: "ScreenContext"):
         """Handle new screen context (called from screen reader thread)."""
         # Emit signal to handle in main thread
         self.screen_context_received.emit(context)
     
-    def _handle_screen_context_safe(self, context: ScreenContext):
+    def _handle_screen_context_safe(self, context: "ScreenContext"):
         """Handle screen context safely in main thread."""
+        # Same text as last time: keep the agent's cached prompt, don't re-suggest
+        ctx_hash = hash(context.text_content)
+        if ctx_hash == self._last_ctx_hash:
+            return
+        self._last_ctx_hash = ctx_hash
+        
         self.ai_agent.update_screen_context(context)
         
         # Generate and speak proactive suggestion if text content is detected
         if context.text_content and len(context.text_content.strip()) > 20:
             logger.info(f"Screen context detected: {len(context.text_content)} characters")
             
-            # Schedule proactive suggestion in main thread
-            QTimer.singleShot(2000, lambda: self._generate_proactive_suggestion())
+            # Restart the quiet window; only the last update in a burst suggests
+            self._suggest_timer.start()
     
     def _show_status(self, message: str):
         """Show temporary status message."""
@@ -794,67 +1006,51 @@ class FloatingAssistant(QWidget):
         """Handle mouse release."""
         self.is_dragging = False
     
-    def _on_token_received(self, token: str):
-        """Handle streaming token from AI."""
-        # This would be used if we used the threaded approach
-        pass
-    
-    def _on_response_complete(self):
-        """Handle completion of AI response."""
-        self.current_response_bubble = None
-    
-    def _on_error_occurred(self, error: str):
-        """Handle AI processing error."""
-        if self.current_response_bubble:
-            self.current_response_bubble.update_text(f"Error: {error}")
-        self.current_response_bubble = None
+    def _request_suggestion(self):
+        """Generate a suggestion once screen context has settled."""
+        self._run_async(self._generate_suggestion_async())
     
-    def _generate_proactive_suggestion(self):
-        """Generate and speak proactive suggestions based on screen content."""
-        try:
-            # Create a task to generate suggestion
-            QTimer.singleShot(0, lambda: self._schedule_suggestion_task())
-        except Exception as e:
-            logger.error(f"Error generating proactive suggestion: {e}")
-    
-    def _schedule_suggestion_task(self):
-        """Schedule async suggestion generation."""
+    async def _generate_suggestion_async(self, delay: float = 0.0):
+        """Generate and speak a proactive suggestion based on screen content."""
+        if self._suggest_inflight:
+            return
+        self._suggest_inflight = True
+        
         try:
-            # Get or create event loop
-            try:
-                loop = asyncio.get_event_loop()
-            except RuntimeError:
-                loop = asyncio.new_event_loop()
-                asyncio.set_event_loop(loop)
+            if delay:
+                await asyncio.sleep(delay)
             
-            # Create task
-            task = loop.create_task(self._generate_suggestion_async())
-            
-        except Exception as e:
-            logger.error(f"Error scheduling suggestion task: {e}")
-    
-    async def _generate_suggestion_async(self):
-        """Generate proactive suggestion asynchronously."""
-        try:
             suggestion = await self.ai_agent.generate_proactive_suggestion()
             if suggestion and VOICE_CONFIG.get("ai_speak_suggestions", True):
                 logger.info(f"Generated suggestion: {suggestion}")
                 
-                # Add suggestion to chat if expanded
-                if self.is_expanded:
-                    self._add_chat_bubble(f"💡 {suggestion}", is_user=False)
+                # Add suggestion to chat (in the UI thread)
+                self.suggestion_signal.emit(f"💡 {suggestion}")
                 
                 # Speak the suggestion using local TTS
-                await self.voice_processor.speak_text(suggestion, use_gtts=False)
+                await self._speak(suggestion, use_gtts=False)
         except Exception as e:
             logger.error(f"Error in suggestion generation: {e}")
+        finally:
+            self._suggest_inflight = False
+    
+    def _show_suggestion(self, text: str):
+        """Add a proactive suggestion to the chat if it is expanded."""
+        if self.is_expanded:
+            self._add_chat_bubble(text, is_user=False)
     
     def closeEvent(self, event):
         """Handle window close event."""
         # Cleanup
         try:
-            self.screen_reader.stop_monitoring()
-            self.voice_processor.stop_listening()
+            if self.screen_reader:
+                self.screen_reader.stop_monitoring()
+            if self.voice_processor:
+                self.voice_processor.stop_listening()
+            self._suggest_timer.stop()
+            for future in list(self._bg_tasks):
+                future.cancel()
+            self._loop.call_soon_threadsafe(self._loop.stop)
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
         
@@ -862,11 +1058,27 @@ class FloatingAssistant(QWidget):
     
     def _startup_screen_analysis(self):
         """Automatically analyze screen and speak on startup."""
+        logger.info("Starting automatic screen analysis...")
+        self._run_async(self._capture_startup_context())
+    
+    async def _capture_startup_context(self):
+        """Capture the startup screen context off the GUI thread."""
+        # The first capture may wait for the OCR model to load, then runs OCR;
+        # neither may block the window
+        loop = asyncio.get_running_loop()
+        try:
+            screen_context = await loop.run_in_executor(
+                None, self.screen_reader.capture_screen_context
+            )
+        except Exception as e:
+            logger.error(f"Error capturing startup screen context: {e}")
+            screen_context = None
+        
+        self.startup_context_signal.emit(screen_context)
+    
+    def _on_startup_context(self, screen_context: Optional["ScreenContext"]):
+        """Greet the user based on the startup screen context."""
         try:
-            logger.info("Starting automatic screen analysis...")
-            # Force capture screen context
-            screen_context = self.screen_reader.capture_screen_context()
-            
             if screen_context and screen_context.text_content.strip():
                 logger.info(f"Screen content captured: {len(screen_context.text_content)} characters")
                 
@@ -886,7 +1098,7 @@ class FloatingAssistant(QWidget):
                 self._speak_response_simple(startup_message)
                 
                 # Generate screen-based suggestion after a delay
-                QTimer.singleShot(4000, self._generate_proactive_suggestion)
+                self._run_async(self._generate_suggestion_async(delay=4.0))
                 
             else:
                 logger.warning("No screen content detected on startup")
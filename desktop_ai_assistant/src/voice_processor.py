@@ -3,27 +3,82 @@ Voice processing module for speech recognition and text-to-speech.
 Handles microphone input, voice recognition, and AI voice output.
 """
 import asyncio
+import collections
+import concurrent.futures
+import contextlib
+import functools
+import hashlib
+import importlib.util
+import json
 import logging
+import math
 import threading
 import time
 import queue
 import tempfile
 import os
-from typing import Optional, Callable, Any
+import re
+import sys
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional, Callable, Any, Deque, List, Tuple
 from dataclasses import dataclass
 
+import numpy as np
 import speech_recognition as sr
-import pyttsx3
-import pygame
-from gtts import gTTS
 import io
 
 from config.settings import VOICE_CONFIG
 
+if TYPE_CHECKING:
+    # pyttsx3 (SAPI/COM bindings), pygame (SDL), gTTS (requests) and
+    # faster_whisper (CTranslate2) are imported where first used
+    import pyttsx3
+    import requests
+    from faster_whisper import WhisperModel
+
+try:
+    import webrtcvad  # Frame-level voice activity detection
+except ImportError:  # Fall back to Recognizer.listen's energy threshold
+    webrtcvad = None
+
 logger = logging.getLogger(__name__)
 
+# dataclass(slots=True) needs Python 3.10; older interpreters keep __dict__
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Synthesized gTTS speech, decoded to raw mixer PCM and keyed by language/speed/text
+# and mixer format, so repeated lines skip both the network and MP3 decoding
+_TTS_CACHE_DIR = Path(tempfile.gettempdir()) / "sage_tts_cache"
+_TTS_CACHE_MAX_FILES = 200
+
+# How often playback completion is checked; bounds the silence after speech ends
+_PLAYBACK_POLL_INTERVAL = 0.01
+
+# Mixer opened for gTTS output: its native 24 kHz mono, with a small buffer
+# so playback starts quickly
+_MIXER_FREQUENCY = 24000
+_MIXER_SIZE = -16
+_MIXER_CHANNELS = 1
+_MIXER_BUFFER = 512
+
+# Text normalization and sentence splitting for pipelined gTTS synthesis
+_WHITESPACE_RE = re.compile(r"\s+")
+_SENTENCE_END_RE = re.compile(r"(?<=[.!?])\s+")
 
-@dataclass
+# Keep-alive connections held open to the gTTS endpoint across utterances
+_GTTS_POOL_CONNECTIONS = 2
+_GTTS_POOL_MAXSIZE = 4
+
+# Utterances recognized at once; more than this and new ones are dropped
+_ASR_MAX_INFLIGHT = 2
+
+# webrtcvad accepts 10/20/30 ms frames of 16-bit mono at these rates
+_VAD_FRAME_MS = 20
+_VAD_SAMPLE_RATES = (8000, 16000, 32000, 48000)
+_VAD_PREROLL_MS = 200
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
 class VoiceResult:
     """Container for voice recognition results."""
     text: str
@@ -33,6 +88,28 @@ class VoiceResult:
     error: Optional[str] = None
 
 
+class _SharedSessionRequests:
+    """
+    Stand-in for the ``requests`` module inside gTTS.
+    
+    gTTS opens (and closes) a new ``requests.Session`` for every request, so
+    each utterance pays for DNS and a TLS handshake. This hands it one
+    long-lived session instead and forwards everything else to ``requests``.
+    """
+    
+    def __init__(self, requests_module, session: "requests.Session"):
+        self._requests = requests_module
+        self._session = session
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._requests, name)
+    
+    @contextlib.contextmanager
+    def Session(self):
+        # Leave the shared session open when gTTS's ``with`` block exits
+        yield self._session
+
+
 class VoiceProcessor:
     """
     Handles voice input (speech recognition) and output (text-to-speech).
@@ -41,55 +118,167 @@ class VoiceProcessor:
     def __init__(self):
         self.recognizer = sr.Recognizer()
         self.microphone: Optional[sr.Microphone] = None
-        self.tts_engine: Optional[pyttsx3.Engine] = None
+        self.tts_engine: Optional["pyttsx3.Engine"] = None
         self.is_listening = False
         self.listen_thread: Optional[threading.Thread] = None
         self.voice_callback: Optional[Callable[[VoiceResult], None]] = None
         
-        # Audio playback
-        pygame.mixer.init()
+        # Local TTS requests for the engine's thread: (text, loop, future)
+        self._tts_queue: queue.Queue = queue.Queue()
+        self._tts_thread: Optional[threading.Thread] = None
+        
+        # Recognition runs on a small pool; utterances beyond its capacity are dropped
+        self._asr_pool: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._asr_inflight = 0
+        self._asr_lock = threading.Lock()
+        
+        # Whisper model, loaded on first recognition
+        self._whisper: Optional["WhisperModel"] = None
+        self._use_whisper = importlib.util.find_spec("faster_whisper") is not None
+        self._whisper_lock = threading.Lock()
+        
+        # Offline fallback recognizer, loaded the first time Google fails
+        self._vosk = None
+        self._use_vosk = importlib.util.find_spec("vosk") is not None
+        self._vosk_lock = threading.Lock()
+        
+        # Pooled HTTP session shared by every gTTS request
+        self._http: Optional["requests.Session"] = None
+        self._http_lock = threading.Lock()
         
         self._initialize_components()
     
     def _initialize_components(self):
         """Initialize voice recognition and TTS components."""
         try:
+            # End phrases on a shorter pause than the library's 0.8 s default
+            self.recognizer.pause_threshold = VOICE_CONFIG["pause_threshold"]
+            self.recognizer.non_speaking_duration = VOICE_CONFIG["non_speaking_duration"]
+            self.recognizer.phrase_threshold = VOICE_CONFIG["phrase_threshold"]
+            
             # Initialize microphone
             self.microphone = sr.Microphone(
                 sample_rate=VOICE_CONFIG["sample_rate"],
                 chunk_size=VOICE_CONFIG["chunk_size"]
             )
             
-            # Adjust for ambient noise
-            with self.microphone as source:
-                self.recognizer.adjust_for_ambient_noise(source, duration=1)
+            # Adjust for ambient noise, or reuse a recent calibration
+            self._calibrate_microphone()
             
             logger.info("Microphone initialized successfully")
             
-            # Initialize TTS engine
-            self.tts_engine = pyttsx3.init()
+            # Initialize TTS engine on its own thread
+            self._start_tts_worker()
+            
+            logger.info("TTS engine initialized successfully")
+            
+        except Exception as e:
+            logger.error(f"Failed to initialize voice components: {e}")
+            raise
+    
+    def _start_tts_worker(self):
+        """Start the thread that owns the pyttsx3 engine and wait until it is ready."""
+        ready = threading.Event()
+        errors: List[Exception] = []
+        self._tts_thread = threading.Thread(
+            target=self._tts_worker, args=(ready, errors), name="tts", daemon=True
+        )
+        self._tts_thread.start()
+        ready.wait()
+        if errors:
+            raise errors[0]
+    
+    def _tts_worker(self, ready: threading.Event, errors: List[Exception]):
+        """
+        Create the pyttsx3 engine and speak queued utterances one at a time.
+        
+        pyttsx3 drivers (SAPI5 COM objects in particular) must be driven from
+        the thread that created them, so every say/runAndWait happens here.
+        """
+        try:
+            import pyttsx3
+            engine = pyttsx3.init()
             
             # Configure TTS settings
-            self.tts_engine.setProperty('rate', 200)  # Speed
-            self.tts_engine.setProperty('volume', 0.8)  # Volume
+            engine.setProperty('rate', 200)  # Speed
+            engine.setProperty('volume', 0.8)  # Volume
             
             # Try to set a pleasant voice
-            voices = self.tts_engine.getProperty('voices')
+            voices = engine.getProperty('voices')
             if voices:
                 # Prefer female voice if available
                 for voice in voices:
                     if 'female' in voice.name.lower() or 'zira' in voice.name.lower():
-                        self.tts_engine.setProperty('voice', voice.id)
+                        engine.setProperty('voice', voice.id)
                         break
                 else:
                     # Use first available voice
-                    self.tts_engine.setProperty('voice', voices[0].id)
-            
-            logger.info("TTS engine initialized successfully")
+                    engine.setProperty('voice', voices[0].id)
             
+            self.tts_engine = engine
         except Exception as e:
-            logger.error(f"Failed to initialize voice components: {e}")
-            raise
+            errors.append(e)
+            return
+        finally:
+            ready.set()
+        
+        while True:
+            text, loop, future = self._tts_queue.get()
+            error = None
+            try:
+                engine.say(text)
+                engine.runAndWait()
+            except Exception as e:
+                error = e
+            loop.call_soon_threadsafe(self._settle_future, future, error)
+    
+    @staticmethod
+    def _settle_future(future: asyncio.Future, error: Optional[Exception]):
+        """Complete a speech future unless its waiter has been cancelled."""
+        if future.done():
+            return
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(None)
+    
+    def _calibrate_microphone(self, force: bool = False):
+        """
+        Set the recognizer's energy threshold from ambient noise.
+        
+        Measuring takes a second of recording, so the result is saved per
+        microphone and reused until it is older than calibration_max_age.
+        """
+        cal_path = Path(VOICE_CONFIG["calibration_file"])
+        device = self.microphone.device_index
+        
+        if not force:
+            try:
+                cached = json.loads(cal_path.read_text())
+                if cached["device"] == device and time.time() - cached["ts"] < VOICE_CONFIG["calibration_max_age"]:
+                    self.recognizer.energy_threshold = cached["energy_threshold"]
+                    logger.debug(f"Using saved microphone calibration: {cached['energy_threshold']:.0f}")
+                    return
+            except (OSError, ValueError, KeyError):
+                pass  # Missing, unreadable or stale; measure again
+        
+        with self.microphone as source:
+            self.recognizer.adjust_for_ambient_noise(source, duration=1)
+        
+        try:
+            cal_path.parent.mkdir(parents=True, exist_ok=True)
+            cal_path.write_text(json.dumps({
+                "energy_threshold": self.recognizer.energy_threshold,
+                "device": device,
+                "ts": time.time(),
+            }))
+        except OSError as e:
+            logger.debug(f"Could not save microphone calibration: {e}")
+    
+    def recalibrate(self):
+        """Measure ambient noise again, replacing the saved calibration."""
+        if self.microphone:
+            self._calibrate_microphone(force=True)
     
     def set_voice_callback(self, callback: Callable[[VoiceResult], None]):
         """Set callback for voice recognition results."""
@@ -101,6 +290,9 @@ class VoiceProcessor:
             return
         
         self.is_listening = True
+        self._asr_pool = concurrent.futures.ThreadPoolExecutor(
+            max_workers=_ASR_MAX_INFLIGHT, thread_name_prefix="asr"
+        )
         self.listen_thread = threading.Thread(target=self._listen_loop, daemon=True)
         self.listen_thread.start()
         logger.info("Voice listening started")
@@ -110,77 +302,140 @@ class VoiceProcessor:
         self.is_listening = False
         if self.listen_thread and self.listen_thread.is_alive():
             self.listen_thread.join(timeout=2.0)
+        if self._asr_pool:
+            # Recognitions already running still deliver their results
+            self._asr_pool.shutdown(wait=False)
+            self._asr_pool = None
         logger.info("Voice listening stopped")
     
     def _listen_loop(self):
         """Main listening loop running in a separate thread."""
+        asr_pool = self._asr_pool
         while self.is_listening and self.microphone:
             try:
-                # Listen for audio with timeout
+                # One stream for the whole session; reopening it per utterance
+                # costs a device open and loses the audio in between
                 with self.microphone as source:
-                    logger.debug("Listening for speech...")
+                    logger.debug("Microphone stream opened")
+                    self._listen_stream(source, asr_pool)
+                
+            except Exception as e:
+                logger.error(f"Error in listening loop: {e}")
+                time.sleep(1.0)  # Brief pause before retrying
+    
+    def _listen_stream(self, source, asr_pool: concurrent.futures.ThreadPoolExecutor):
+        """Capture utterances from an open microphone source until listening stops."""
+        while self.is_listening:
+            try:
+                # Listen for audio with timeout
+                logger.debug("Listening for speech...")
+                if self._can_use_vad(source):
+                    audio = self._listen_vad(source, timeout=VOICE_CONFIG["speech_timeout"])
+                else:
                     audio = self.recognizer.listen(
                         source,
                         timeout=VOICE_CONFIG["speech_timeout"],
                         phrase_time_limit=VOICE_CONFIG["phrase_timeout"]
                     )
-                
-                # Process the audio in the background
-                threading.Thread(
-                    target=self._process_audio,
-                    args=(audio,),
-                    daemon=True
-                ).start()
-                
             except sr.WaitTimeoutError:
                 # No speech detected within timeout - this is normal
                 continue
-            except Exception as e:
-                logger.error(f"Error in listening loop: {e}")
-                time.sleep(1.0)  # Brief pause before retrying
+            
+            # Process the audio in the background, unless recognition is backed up
+            with self._asr_lock:
+                if self._asr_inflight >= _ASR_MAX_INFLIGHT:
+                    logger.warning("Speech recognition busy, dropping utterance")
+                    continue
+                self._asr_inflight += 1
+            try:
+                asr_pool.submit(self._process_audio_pooled, audio)
+            except RuntimeError:
+                # stop_listening shut the pool down while we were listening
+                with self._asr_lock:
+                    self._asr_inflight -= 1
+                return
+    
+    @staticmethod
+    def _can_use_vad(source) -> bool:
+        """Check that webrtcvad is installed and supports the source's audio format."""
+        return (
+            webrtcvad is not None
+            and source.SAMPLE_WIDTH == 2
+            and source.SAMPLE_RATE in _VAD_SAMPLE_RATES
+        )
+    
+    def _listen_vad(self, source, timeout: float) -> "sr.AudioData":
+        """
+        Capture one chunk of speech, cut on silence detected by webrtcvad.
+        
+        A chunk ends after vad_silence_ms of non-speech, and that allowance
+        shrinks as the chunk nears vad_max_chunk_ms so long speech is split at
+        the nearest pause rather than mid-word at a fixed limit.
+        
+        Raises:
+            sr.WaitTimeoutError: If no speech starts within timeout seconds
+        """
+        vad = webrtcvad.Vad(VOICE_CONFIG["vad_aggressiveness"])
+        sample_rate = source.SAMPLE_RATE
+        frame_bytes = sample_rate * _VAD_FRAME_MS // 1000 * source.SAMPLE_WIDTH
+        max_silence_ms = VOICE_CONFIG["vad_silence_ms"]
+        max_chunk_ms = VOICE_CONFIG["vad_max_chunk_ms"]
+        
+        preroll: Deque[bytes] = collections.deque(maxlen=_VAD_PREROLL_MS // _VAD_FRAME_MS)
+        speech: List[bytes] = []
+        pending = b""
+        waited_ms = 0
+        speech_ms = 0
+        silence_ms = 0
+        
+        while self.is_listening:
+            pending += source.stream.read(source.CHUNK)
+            while len(pending) >= frame_bytes:
+                frame, pending = pending[:frame_bytes], pending[frame_bytes:]
+                is_speech = vad.is_speech(frame, sample_rate)
+                
+                if not speech:
+                    # Waiting for speech to start; keep a little audio before it
+                    if is_speech:
+                        speech.extend(preroll)
+                        speech.append(frame)
+                        speech_ms = _VAD_FRAME_MS
+                        continue
+                    preroll.append(frame)
+                    waited_ms += _VAD_FRAME_MS
+                    if waited_ms >= timeout * 1000:
+                        raise sr.WaitTimeoutError("listening timed out while waiting for phrase to start")
+                    continue
+                
+                speech.append(frame)
+                speech_ms += _VAD_FRAME_MS
+                silence_ms = 0 if is_speech else silence_ms + _VAD_FRAME_MS
+                
+                # Allowed trailing silence falls linearly to a single frame at max length
+                remaining = max(0.0, 1.0 - speech_ms / max_chunk_ms)
+                if silence_ms >= max(_VAD_FRAME_MS, max_silence_ms * remaining) or speech_ms >= max_chunk_ms:
+                    return sr.AudioData(b"".join(speech), sample_rate, source.SAMPLE_WIDTH)
+        
+        raise sr.WaitTimeoutError("listening stopped")
+    
+    def _process_audio_pooled(self, audio):
+        """Run _process_audio on the recognition pool and release its slot."""
+        try:
+            self._process_audio(audio)
+        finally:
+            with self._asr_lock:
+                self._asr_inflight -= 1
     
     def _process_audio(self, audio):
         """Process captured audio and perform speech recognition."""
         try:
             start_time = time.time()
             
-            # Try Google Speech Recognition first
-            try:
-                text = self.recognizer.recognize_google(audio)
-                confidence = 0.8  # Google doesn't provide confidence, assume good
-                success = True
-                error = None
-                logger.debug(f"Google SR recognized: {text}")
-                
-            except sr.UnknownValueError:
-                # Try offline recognition as fallback
-                try:
-                    text = self.recognizer.recognize_sphinx(audio)
-                    confidence = 0.6  # Lower confidence for offline
-                    success = True
-                    error = None
-                    logger.debug(f"Sphinx SR recognized: {text}")
-                    
-                except (sr.UnknownValueError, sr.RequestError):
-                    text = ""
-                    confidence = 0.0
-                    success = False
-                    error = "Could not understand audio"
-                    
-            except sr.RequestError as e:
-                # Try offline recognition as fallback
-                try:
-                    text = self.recognizer.recognize_sphinx(audio)
-                    confidence = 0.6
-                    success = True
-                    error = None
-                    logger.debug(f"Sphinx SR recognized (fallback): {text}")
-                    
-                except (sr.UnknownValueError, sr.RequestError):
-                    text = ""
-                    confidence = 0.0
-                    success = False
-                    error = f"Recognition service error: {e}"
+            # Local Whisper first; the online recognizer only if it is unavailable or fails
+            recognized = self._recognize_whisper(audio)
+            if recognized is None:
+                recognized = self._recognize_online(audio)
+            text, confidence, success, error = recognized
             
             # Create result object
             result = VoiceResult(
@@ -208,6 +463,95 @@ class VoiceProcessor:
             if self.voice_callback:
                 self.voice_callback(result)
     
+    def _recognize_whisper(self, audio) -> Optional[Tuple[str, float, bool, Optional[str]]]:
+        """
+        Recognize locally with faster-whisper.
+        
+        Returns (text, confidence, success, error), or None when Whisper is not
+        installed or failed so the caller can use the online recognizer.
+        """
+        if not self._use_whisper:
+            return None
+        
+        try:
+            with self._whisper_lock:
+                if self._whisper is None:
+                    # A model that can't be loaded (e.g. no download) isn't retried
+                    self._use_whisper = False
+                    from faster_whisper import WhisperModel
+                    self._whisper = WhisperModel(
+                        VOICE_CONFIG["whisper_model"],
+                        device="cpu",
+                        compute_type=VOICE_CONFIG["whisper_compute_type"]
+                    )
+                    self._use_whisper = True
+                    logger.info(f"Loaded Whisper model {VOICE_CONFIG['whisper_model']}")
+            
+            # 16 kHz mono float32 in [-1, 1], as Whisper expects
+            pcm = np.frombuffer(audio.get_raw_data(convert_rate=16000, convert_width=2), dtype=np.int16)
+            samples = pcm.astype(np.float32) / 32768.0
+            
+            segments, _ = self._whisper.transcribe(samples, beam_size=1, vad_filter=True)
+            segments = list(segments)
+            text = " ".join(segment.text.strip() for segment in segments).strip()
+            if not text:
+                return "", 0.0, False, "Could not understand audio"
+            
+            # Mean token log-probability as a 0..1 confidence
+            confidence = math.exp(sum(segment.avg_logprob for segment in segments) / len(segments))
+            logger.debug(f"Whisper recognized: {text}")
+            return text, confidence, True, None
+            
+        except Exception as e:
+            logger.error(f"Whisper recognition failed, using online recognizer: {e}")
+            return None
+    
+    def _recognize_online(self, audio) -> Tuple[str, float, bool, Optional[str]]:
+        """Recognize with Google, falling back to Vosk; returns (text, confidence, success, error)."""
+        # Try Google Speech Recognition first
+        try:
+            text = self.recognizer.recognize_google(audio)
+            logger.debug(f"Google SR recognized: {text}")
+            return text, 0.8, True, None  # Google doesn't provide confidence, assume good
+        
+        except sr.UnknownValueError:
+            error = "Could not understand audio"
+        except sr.RequestError as e:
+            error = f"Recognition service error: {e}"
+        
+        # Try offline recognition as fallback
+        text = self._recognize_vosk(audio)
+        if text:
+            logger.debug(f"Vosk recognized (fallback): {text}")
+            return text, 0.6, True, None  # Lower confidence for offline
+        
+        return "", 0.0, False, error
+    
+    def _recognize_vosk(self, audio) -> Optional[str]:
+        """Recognize offline with a small Vosk model; None if unavailable or nothing heard."""
+        if not self._use_vosk:
+            return None
+        
+        try:
+            with self._vosk_lock:
+                if self._vosk is None:
+                    # A model that can't be loaded (e.g. no download) isn't retried
+                    self._use_vosk = False
+                    from vosk import Model
+                    model_path = VOICE_CONFIG["vosk_model_path"]
+                    self._vosk = Model(model_path=str(model_path)) if model_path else Model(lang="en-us")
+                    self._use_vosk = True
+                    logger.info("Loaded Vosk model")
+            
+            from vosk import KaldiRecognizer
+            recognizer = KaldiRecognizer(self._vosk, 16000)
+            recognizer.AcceptWaveform(audio.get_raw_data(convert_rate=16000, convert_width=2))
+            return json.loads(recognizer.FinalResult()).get("text", "").strip() or None
+            
+        except Exception as e:
+            logger.error(f"Vosk recognition failed: {e}")
+            return None
+    
     def listen_once(self, timeout: float = 5.0) -> VoiceResult:
         """
         Listen for a single voice input with timeout.
@@ -226,6 +570,15 @@ class VoiceProcessor:
                 success=False,
                 error="Microphone not available"
             )
+        if self.is_listening:
+            # The continuous listener holds the microphone stream open
+            return VoiceResult(
+                text="",
+                confidence=0.0,
+                timestamp=time.time(),
+                success=False,
+                error="Continuous listening is active"
+            )
         
         try:
             with self.microphone as source:
@@ -255,6 +608,17 @@ class VoiceProcessor:
     
     def _process_audio_sync(self, audio) -> VoiceResult:
         """Synchronously process audio and return result."""
+        recognized = self._recognize_whisper(audio)
+        if recognized is not None:
+            text, confidence, success, error = recognized
+            return VoiceResult(
+                text=text,
+                confidence=confidence,
+                timestamp=time.time(),
+                success=success,
+                error=error
+            )
+        
         try:
             # Try Google Speech Recognition
             text = self.recognizer.recognize_google(audio)
@@ -306,50 +670,238 @@ class VoiceProcessor:
                 await self._speak_with_pyttsx3(text)
     
     async def _speak_with_gtts(self, text: str):
-        """Use Google TTS for speech synthesis."""
+        """Use Google TTS for speech synthesis, one sentence at a time."""
+        sentences = self._split_sentences(text)
+        if not sentences:
+            return
+        
+        # Only open the audio device once gTTS is actually used
+        self._ensure_mixer()
+        loop = asyncio.get_running_loop()
+        
+        # Queue every sentence now so the first one plays as soon as its first
+        # audio arrives while the next few are fetched behind it; only as many
+        # run at once as the session pool keeps connections for
+        slots = asyncio.Semaphore(_GTTS_POOL_MAXSIZE)
+        chunk_queues: List[asyncio.Queue] = []
+        tasks = []
+        for sentence in sentences:
+            chunks: asyncio.Queue = asyncio.Queue()
+            on_chunk = functools.partial(loop.call_soon_threadsafe, chunks.put_nowait)
+            chunk_queues.append(chunks)
+            tasks.append(asyncio.ensure_future(
+                self._run_gtts_job(slots, self._stream_gtts, sentence, on_chunk)
+            ))
+        
+        played = 0
         try:
-            # Create TTS object
-            tts = gTTS(
-                text=text,
-                lang=VOICE_CONFIG["tts_language"],
-                slow=VOICE_CONFIG["tts_slow"]
-            )
-            
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.mp3') as tmp_file:
-                tts.save(tmp_file.name)
-                tmp_filename = tmp_file.name
+            for chunks, task in zip(chunk_queues, tasks):
+                await self._play_pcm_chunks(chunks)
+                # Surface a synthesis error once whatever did arrive has played
+                await task
+                played += 1
+                    
+        except Exception as e:
+            logger.error(f"gTTS error: {e}")
+        else:
+            return
+        finally:
+            for task in tasks:
+                task.cancel()
+        
+        # Earlier sentences were already heard; speak the rest with local TTS
+        await self._speak_with_pyttsx3(" ".join(sentences[played:]))
+    
+    @staticmethod
+    async def _run_gtts_job(slots: asyncio.Semaphore, func: Callable, *args) -> Any:
+        """Run a blocking gTTS job in the default executor once a slot is free."""
+        async with slots:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, func, *args)
+    
+    def _stream_gtts(self, text: str, on_chunk: Callable[[Optional[bytes]], None]):
+        """Synthesize one sentence, passing PCM to on_chunk as it arrives and None when done."""
+        try:
+            self._synthesize_gtts(text, on_chunk)
+        finally:
+            on_chunk(None)
+    
+    @staticmethod
+    async def _play_pcm_chunks(chunks: asyncio.Queue):
+        """Play PCM chunks back to back as they arrive, until a None marks the end."""
+        import pygame
+        
+        channel = None
+        while True:
+            pcm = await chunks.get()
+            if pcm is None:
+                break
             
-            # Play the audio file
-            pygame.mixer.music.load(tmp_filename)
-            pygame.mixer.music.play()
+            # Already decoded, so playback starts without an MP3 decode
+            sound = pygame.mixer.Sound(buffer=pcm)
+            if channel is None or not channel.get_busy():
+                channel = sound.play()
+            else:
+                # The channel holds one queued sound; wait for its slot to free up
+                while channel.get_queue() is not None:
+                    await asyncio.sleep(_PLAYBACK_POLL_INTERVAL)
+                channel.queue(sound)
+        
+        # Wait for playback to finish
+        while channel is not None and channel.get_busy():
+            await asyncio.sleep(_PLAYBACK_POLL_INTERVAL)
+    
+    async def prewarm_tts(self, phrases: Optional[List[str]] = None):
+        """
+        Fill the gTTS cache for canned phrases without playing them.
+        
+        This opens the audio device and calls Google TTS, so only call it when
+        speech actually goes through gTTS.
+        
+        Args:
+            phrases: Lines to synthesize; defaults to VOICE_CONFIG["precomputed_phrases"]
+        """
+        if phrases is None:
+            phrases = VOICE_CONFIG.get("precomputed_phrases", [])
+        sentences = [s for phrase in phrases for s in self._split_sentences(phrase)]
+        if not sentences:
+            return
+        
+        # Decoding to PCM needs the mixer's sample format
+        self._ensure_mixer()
+        
+        slots = asyncio.Semaphore(_GTTS_POOL_MAXSIZE)
+        results = await asyncio.gather(
+            *(self._run_gtts_job(slots, self._synthesize_gtts, s) for s in sentences),
+            return_exceptions=True
+        )
+        failed = sum(isinstance(r, Exception) for r in results)
+        if failed:
+            logger.warning(f"TTS prewarm failed for {failed} of {len(sentences)} phrases")
+        else:
+            logger.info(f"TTS cache prewarmed with {len(sentences)} phrases")
+    
+    @staticmethod
+    def _split_sentences(text: str) -> List[str]:
+        """Collapse whitespace and split text into sentences for synthesis."""
+        clean = _WHITESPACE_RE.sub(" ", text).strip()
+        return [s for s in _SENTENCE_END_RE.split(clean) if s]
+    
+    def _synthesize_gtts(
+        self, text: str, on_chunk: Optional[Callable[[bytes], None]] = None
+    ) -> bytes:
+        """
+        Get mixer PCM for one sentence, from the cache or from Google TTS.
+        
+        Args:
+            text: Sentence to synthesize
+            on_chunk: Called with each piece of PCM as soon as it is decoded
+        """
+        import pygame
+        
+        cache_path = self._tts_cache_path(text, pygame.mixer.get_init())
+        
+        if cache_path.exists():
+            pcm = cache_path.read_bytes()
+            # Refresh mtime so eviction treats it as recently used
+            os.utime(cache_path)
+            if on_chunk:
+                on_chunk(pcm)
+            return pcm
+        
+        self._ensure_gtts_session()
+        
+        from gtts import gTTS
+        tts = gTTS(
+            text=text,
+            lang=VOICE_CONFIG["tts_language"],
+            slow=VOICE_CONFIG["tts_slow"]
+        )
+        
+        # gTTS fetches long text in several requests, each a complete MP3;
+        # decode each once to the mixer's sample format and hand it on
+        # straight away instead of waiting for the whole sentence
+        parts = []
+        for mp3 in tts.stream():
+            part = pygame.mixer.Sound(file=io.BytesIO(mp3)).get_raw()
+            if on_chunk:
+                on_chunk(part)
+            parts.append(part)
+        
+        pcm = b"".join(parts)
+        self._store_tts_cache(cache_path, pcm)
+        return pcm
+    
+    @staticmethod
+    def _ensure_mixer():
+        """Initialize the pygame mixer for speech playback if it isn't already."""
+        import pygame
+        
+        if not pygame.mixer.get_init():
+            pygame.mixer.init(
+                frequency=_MIXER_FREQUENCY,
+                size=_MIXER_SIZE,
+                channels=_MIXER_CHANNELS,
+                buffer=_MIXER_BUFFER
+            )
+    
+    def _ensure_gtts_session(self):
+        """Route gTTS through one pooled keep-alive session, created on first use."""
+        with self._http_lock:
+            if self._http is not None:
+                return
             
-            # Wait for playback to finish
-            while pygame.mixer.music.get_busy():
-                await asyncio.sleep(0.1)
+            import requests
+            import gtts.tts
+            from requests.adapters import HTTPAdapter
             
-            # Clean up temporary file
-            try:
-                os.unlink(tmp_filename)
-            except:
-                pass
-                
-        except Exception as e:
-            logger.error(f"gTTS error: {e}")
-            raise
+            session = requests.Session()
+            session.mount("https://", HTTPAdapter(
+                pool_connections=_GTTS_POOL_CONNECTIONS,
+                pool_maxsize=_GTTS_POOL_MAXSIZE
+            ))
+            gtts.tts.requests = _SharedSessionRequests(requests, session)
+            self._http = session
+    
+    @staticmethod
+    def _tts_cache_path(text: str, mixer_format: Tuple[int, int, int]) -> Path:
+        """Get the cache file for text spoken with the configured gTTS settings."""
+        frequency, size, channels = mixer_format
+        key = hashlib.sha1(
+            f"{VOICE_CONFIG['tts_language']}|{VOICE_CONFIG['tts_slow']}|{text}".encode("utf-8")
+        ).hexdigest()
+        return _TTS_CACHE_DIR / f"{key}.{frequency}_{size}_{channels}.pcm"
+    
+    def _store_tts_cache(self, cache_path: Path, audio: bytes):
+        """Write synthesized audio to the cache without ever exposing a partial file."""
+        try:
+            _TTS_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            tmp_path = cache_path.with_suffix(".part")
+            tmp_path.write_bytes(audio)
+            os.replace(tmp_path, cache_path)
+            self._evict_tts_cache()
+        except OSError as e:
+            logger.debug(f"TTS cache write skipped: {e}")
+    
+    @staticmethod
+    def _evict_tts_cache():
+        """Delete the least recently used cache files beyond the size limit."""
+        try:
+            files = sorted(_TTS_CACHE_DIR.glob("*.pcm"), key=lambda p: p.stat().st_mtime)
+            for path in files[:-_TTS_CACHE_MAX_FILES]:
+                path.unlink(missing_ok=True)
+        except OSError as e:
+            logger.debug(f"TTS cache eviction skipped: {e}")
     
     async def _speak_with_pyttsx3(self, text: str):
         """Use local TTS engine for speech synthesis."""
         try:
             if self.tts_engine:
-                # Run TTS in thread to avoid blocking
-                def speak_sync():
-                    self.tts_engine.say(text)
-                    self.tts_engine.runAndWait()
-                
-                # Run in executor to avoid blocking the event loop
-                loop = asyncio.get_event_loop()
-                await loop.run_in_executor(None, speak_sync)
+                # Hand off to the engine's thread and wait for it to finish speaking
+                loop = asyncio.get_running_loop()
+                future = loop.create_future()
+                self._tts_queue.put((text, loop, future))
+                await future
                 
         except Exception as e:
             logger.error(f"pyttsx3 error: {e}")
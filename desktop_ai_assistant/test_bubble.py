@@ -9,8 +9,33 @@ from PySide6.QtWidgets import QApplication, QWidget, QVBoxLayout, QScrollArea
 from PySide6.QtCore import QTimer
 from src.ui import ChatBubble
 
+def _count_text_lines(image):
+    """Count horizontal bands of rows that contain non-background pixels."""
+    background = image.pixel(0, 0)
+    lines = 0
+    in_line = False
+    for y in range(image.height()):
+        has_ink = any(image.pixel(x, y) != background for x in range(image.width()))
+        if has_ink and not in_line:
+            lines += 1
+        in_line = has_ink
+    return lines
+
+def test_multiline_bubble():
+    app = QApplication.instance() or QApplication(sys.argv)
+    
+    # Each "\n" must start a new painted line, not be glued to the previous one
+    bubble = ChatBubble("Sure! Here's a list:\n- one\n- two\n\nDone.", is_user=False)
+    bubble.text_label.set_cache_enabled(False)
+    bubble.text_label.setStyleSheet("background: transparent; color: white;")
+    bubble.text_label.resize(bubble.text_label.sizeHint())
+    lines = _count_text_lines(bubble.text_label.grab().toImage())
+    
+    print(f"Multi-line bubble painted {lines} lines")
+    assert lines == 4, f"expected 4 painted lines, got {lines}"
+
 def test_bubble_visibility():
-    app = QApplication(sys.argv)
+    app = QApplication.instance() or QApplication(sys.argv)
     
     # Create a simple window
     window = QWidget()
@@ -27,13 +52,16 @@ def test_bubble_visibility():
     content_widget = QWidget()
     content_layout = QVBoxLayout(content_widget)
     
-    # Add test bubbles
+    # Add test bubbles in one batch: a single layout/paint pass for both
     user_bubble = ChatBubble("This is a user message", is_user=True)
     ai_bubble = ChatBubble("This is an AI response", is_user=False)
     
+    content_widget.setUpdatesEnabled(False)
     content_layout.addWidget(user_bubble)
     content_layout.addWidget(ai_bubble)
     content_layout.addStretch()
+    content_widget.setUpdatesEnabled(True)
+    content_widget.update()
     
     scroll_area.setWidget(content_widget)
     layout.addWidget(scroll_area)
@@ -52,4 +80,5 @@ def test_bubble_visibility():
     app.exec()
 
 if __name__ == "__main__":
+    test_multiline_bubble()
     test_bubble_visibility()
@@ -19,9 +19,12 @@ def test_chat_bubble():
     # Expand the chat
     assistant.toggle_expand()
     
-    # Add test messages
+    # Add test messages in one batch: a single layout/paint pass for both
+    assistant.chat_content.setUpdatesEnabled(False)
     assistant._add_chat_bubble("Test user message", is_user=True)
     bubble = assistant._add_chat_bubble("Test AI response", is_user=False)
+    assistant.chat_content.setUpdatesEnabled(True)
+    assistant.chat_content.update()
     
     print(f"Created bubble: {bubble}")
     print(f"Bubble visible: {bubble.isVisible()}")
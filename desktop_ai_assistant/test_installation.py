@@ -2,6 +2,8 @@
 Test script to verify SAGE Desktop AI Assistant installation and functionality.
 """
 import sys
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
 from pathlib import Path
 
@@ -19,7 +21,13 @@ logger = logging.getLogger(__name__)
 
 
 def test_imports():
-    """Test that all required modules can be imported."""
+    """
+    Test that all required modules are installed.
+    
+    Modules are located with importlib.util.find_spec rather than imported, so
+    this is a filesystem probe instead of seconds of TensorFlow/Qt start-up;
+    the component and UI tests below import them for real.
+    """
     print("Testing imports...")
     
     tests = [
@@ -41,10 +49,14 @@ def test_imports():
     
     for module_name, description in tests:
         try:
-            __import__(module_name)
+            found = importlib.util.find_spec(module_name) is not None
+        except ImportError:  # Parent package of a dotted name is missing
+            found = False
+        
+        if found:
             print(f"  ✓ {description}")
-        except ImportError as e:
-            print(f"  ✗ {description}: {e}")
+        else:
+            print(f"  ✗ {description}: No module named '{module_name}'")
             failed.append(module_name)
     
     return len(failed) == 0, failed
@@ -58,9 +70,11 @@ def test_keras_ocr():
         import keras_ocr
         print(f"  ✓ KerasOCR imported successfully")
         
-        # Try to initialize pipeline (may take time on first run)
+        # Try to initialize pipeline (may take time on first run); the screen
+        # reader in test_components reuses this shared instance
+        from src.screen_reader import get_pipeline
         print("  📦 Initializing KerasOCR pipeline (may download models on first run)...")
-        pipeline = keras_ocr.pipeline.Pipeline()
+        pipeline = get_pipeline()
         print(f"  ✓ KerasOCR pipeline initialized")
         return True
     except Exception as e:
@@ -94,44 +108,55 @@ def test_config():
         return False
 
 
+def _probe_screen_reader():
+    """Create the screen reader."""
+    from src.screen_reader import get_screen_reader
+    get_screen_reader()
+    return "✓ Screen reader initialized"
+
+
+def _probe_voice_processor():
+    """Create the voice processor and check for a microphone."""
+    from src.voice_processor import get_voice_processor
+    voice_processor = get_voice_processor()
+    if voice_processor.is_microphone_available():
+        return "✓ Voice processor initialized with microphone"
+    return "⚠ Voice processor initialized but no microphone"
+
+
+def _probe_ai_agent():
+    """Create the AI agent."""
+    from src.ai_agent import get_ai_agent
+    get_ai_agent()
+    return "✓ AI agent initialized"
+
+
+def _probe_database():
+    """Open the database manager."""
+    from src.database import get_database_manager
+    get_database_manager()
+    return "✓ Database manager initialized"
+
+
 def test_components():
     """Test individual components."""
     print("\nTesting components...")
     
-    # Test screen reader
-    try:
-        from src.screen_reader import get_screen_reader
-        screen_reader = get_screen_reader()
-        print(f"  ✓ Screen reader initialized")
-    except Exception as e:
-        print(f"  ✗ Screen reader error: {e}")
-    
-    # Test voice processor
-    try:
-        from src.voice_processor import get_voice_processor
-        voice_processor = get_voice_processor()
-        if voice_processor.is_microphone_available():
-            print(f"  ✓ Voice processor initialized with microphone")
-        else:
-            print(f"  ⚠ Voice processor initialized but no microphone")
-    except Exception as e:
-        print(f"  ✗ Voice processor error: {e}")
+    probes = {
+        "Screen reader": _probe_screen_reader,
+        "Voice processor": _probe_voice_processor,
+        "AI agent": _probe_ai_agent,
+        "Database": _probe_database,
+    }
     
-    # Test AI agent
-    try:
-        from src.ai_agent import get_ai_agent
-        ai_agent = get_ai_agent()
-        print(f"  ✓ AI agent initialized")
-    except Exception as e:
-        print(f"  ✗ AI agent error: {e}")
-    
-    # Test database
-    try:
-        from src.database import get_database_manager
-        db_manager = get_database_manager()
-        print(f"  ✓ Database manager initialized")
-    except Exception as e:
-        print(f"  ✗ Database error: {e}")
+    # Model loading, mic calibration and DB setup overlap instead of adding up
+    with ThreadPoolExecutor(max_workers=len(probes)) as executor:
+        futures = {executor.submit(probe): name for name, probe in probes.items()}
+        for future in as_completed(futures):
+            try:
+                print(f"  {future.result()}")
+            except Exception as e:
+                print(f"  ✗ {futures[future]} error: {e}")
 
 
 def test_ui_creation():
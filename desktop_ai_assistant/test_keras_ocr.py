@@ -20,9 +20,9 @@ def test_keras_ocr_basic():
     print("Testing basic KerasOCR functionality...")
     
     try:
-        import keras_ocr
         import numpy as np
         from PIL import Image, ImageDraw, ImageFont
+        from src.screen_reader import get_pipeline
         
         # Create a simple test image with text
         print("Creating test image...")
@@ -40,9 +40,9 @@ def test_keras_ocr_basic():
         # Convert PIL to numpy array (RGB format)
         img_array = np.array(img)
         
-        # Initialize KerasOCR pipeline
+        # Initialize the shared KerasOCR pipeline; the screen reader test reuses it
         print("Initializing KerasOCR pipeline (may take a moment)...")
-        pipeline = keras_ocr.pipeline.Pipeline()
+        pipeline = get_pipeline()
         
         # Recognize text
         print("Recognizing text...")